@@ -46,43 +46,10 @@ if is_production:
     app.config["SQLALCHEMY_DATABASE_URI"] = database_url
     app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
         "pool_pre_ping": True,
-        "pool_size": 5,
-        "max_overflow": 10,
-        "pool_timeout": 30
-    }
-else:
-    # Use SQLite for local development only
-    database_url = "sqlite:///development.db"
-    logger.info("Using local SQLite database for development")
-    app.config["SQLALCHEMY_DATABASE_URI"] = database_url
-    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {}
-
-# Strict environment validation
-is_production = os.environ.get('REPL_ENVIRONMENT') == 'production'
-is_deployment = os.environ.get('REPLIT_DEPLOYMENT') == '1'
-logger.info(f"Running in {'production' if is_production else 'development'} environment")
-logger.info(f"Deployment status: {'deployment' if is_deployment else 'local'}")
-
-if is_production and not is_deployment:
-    logger.error("Production environment detected without deployment flag - preventing startup")
-    raise EnvironmentError("Cannot run production environment locally")
-
-# Configure database URL based on environment
-if is_production:
-    # Use PostgreSQL in production
-    database_url = os.environ.get("DATABASE_URL")
-    if not database_url:
-        logger.error("DATABASE_URL not set in production environment")
-        raise ValueError("DATABASE_URL must be set in production environment")
-    logger.info("Using production PostgreSQL database")
-
-    # Configure SQLAlchemy for PostgreSQL
-    app.config["SQLALCHEMY_DATABASE_URI"] = database_url
-    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-        "pool_pre_ping": True,
-        "pool_size": 5,
-        "max_overflow": 10,
-        "pool_timeout": 30
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800  # Drop connections before the server times them out
     }
 else:
     # Use SQLite for local development only
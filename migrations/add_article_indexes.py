@@ -0,0 +1,27 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db
+import logging
+from sqlalchemy import text
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+def add_article_indexes():
+    """Index article columns used by the weekly conflict checks"""
+    try:
+        with app.app_context():
+            with db.engine.begin() as conn:
+                logger.info("Creating article indexes")
+                conn.execute(text("CREATE INDEX IF NOT EXISTS ix_article_pub_date ON article (publication_date)"))
+                conn.execute(text("CREATE INDEX IF NOT EXISTS ix_article_status ON article (status)"))
+            logger.info("Successfully created article indexes")
+
+    except Exception as e:
+        logger.error(f"Error creating article indexes: {str(e)}")
+        raise
+
+if __name__ == '__main__':
+    add_article_indexes()
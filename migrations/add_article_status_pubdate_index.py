@@ -0,0 +1,30 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db
+import logging
+from sqlalchemy import text
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+def add_article_status_pubdate_index():
+    """Replace the status index with one on (status, publication_date)"""
+    try:
+        with app.app_context():
+            with db.engine.begin() as conn:
+                logger.info("Creating article status/publication date index")
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_article_status_pubdate ON article (status, publication_date)"
+                ))
+                # Status-only lookups use the leading column of the new index
+                conn.execute(text("DROP INDEX IF EXISTS ix_article_status"))
+            logger.info("Successfully created article status/publication date index")
+
+    except Exception as e:
+        logger.error(f"Error creating article status/publication date index: {str(e)}")
+        raise
+
+if __name__ == '__main__':
+    add_article_status_pubdate_index()
@@ -0,0 +1,40 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db
+import logging
+from sqlalchemy import text
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Monday of the article's week, as Postgres and SQLite (development) compute it
+WEEK_EXPRESSIONS = {
+    'postgresql': "date_trunc('week', publication_date)",
+    'sqlite': "date(publication_date, '-6 days', 'weekday 1')",
+}
+
+def add_unique_article_week():
+    """Allow only one article per week
+
+    Run remove_duplicate_articles.py first if the index creation fails on existing duplicates.
+    """
+    try:
+        with app.app_context():
+            week = WEEK_EXPRESSIONS[db.engine.dialect.name]
+            with db.engine.begin() as conn:
+                logger.info("Creating unique article week index")
+                conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ux_article_week ON article ({week})"))
+                # The earlier exact-timestamp index only blocked identical dates; a
+                # plain index keeps serving the week range lookups
+                conn.execute(text("CREATE INDEX IF NOT EXISTS ix_article_pub_date ON article (publication_date)"))
+                conn.execute(text("DROP INDEX IF EXISTS ux_article_pub_date"))
+            logger.info("Successfully created unique article week index")
+
+    except Exception as e:
+        logger.error(f"Error creating unique article week index: {str(e)}")
+        raise
+
+if __name__ == '__main__':
+    add_unique_article_week()
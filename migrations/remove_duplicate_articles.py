@@ -19,13 +19,13 @@ def remove_duplicate_articles():
     """Remove duplicate articles while preserving sources"""
     try:
         with app.app_context():
-            # Find groups of duplicate articles by date
+            # Find groups of duplicate articles by week, as the unique index counts them
             duplicate_groups = db.session.query(
-                func.date_trunc('day', Article.publication_date).label('pub_date'),
+                func.date_trunc('week', Article.publication_date).label('pub_date'),
                 func.array_agg(Article.id).label('article_ids'),
                 func.count(Article.id).label('count')
             ).group_by(
-                func.date_trunc('day', Article.publication_date)
+                func.date_trunc('week', Article.publication_date)
             ).having(
                 func.count(Article.id) > 1
             ).all()
@@ -31,6 +31,13 @@ class User(UserMixin, db.Model):
 
 
 class Article(db.Model):
+    __table_args__ = (
+        # Week range lookups; one article per week is enforced by ux_article_week below
+        db.Index('ix_article_pub_date', 'publication_date'),
+        # Status filters ordered by date: published listings, latest failed article
+        db.Index('ix_article_status_pubdate', 'status', 'publication_date'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
@@ -63,6 +70,9 @@ class Article(db.Model):
         self.scheduled_publish_date = publish_date
         db.session.commit()
 
+        from services.scheduler import schedule_publication
+        schedule_publication(self.id, publish_date)
+
     @property
     def brief_summary(self):
         """Extract brief summary from content."""
@@ -173,6 +183,16 @@ class Article(db.Model):
             self.custom_url = f"week-of-{monday.strftime('%Y-%m-%d')}"
 
 
+# One article per week, even under concurrent generation: a unique index on the
+# Monday of each publication date. Postgres and SQLite spell the truncation differently.
+db.Index(
+    'ux_article_week', db.func.date_trunc('week', Article.__table__.c.publication_date), unique=True
+).ddl_if(dialect='postgresql')
+db.Index(
+    'ux_article_week', db.func.date(Article.__table__.c.publication_date, '-6 days', 'weekday 1'), unique=True
+).ddl_if(dialect='sqlite')
+
+
 class Source(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     url = db.Column(db.String(500), nullable=False)
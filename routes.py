@@ -11,9 +11,10 @@ from flask_login import current_user, login_user, logout_user, login_required
 
 from app import app, db
 from models import Article, User, Source
+from sqlalchemy.exc import IntegrityError
 import pytz
 import logging
-from services.new_article_generation_service import NewArticleGenerationService
+from services.new_article_generation_service import GenerationStart, NewArticleGenerationService
 
 # Setup logging
 logging.basicConfig(
@@ -402,6 +403,11 @@ def new_article() -> Union[str, Response]:
             logger.error(f"Invalid date format in new article creation: {str(e)}")
             flash('Invalid date format. Please use YYYY-MM-DD format.', 'error')
             return render_template('admin/article_form.html')
+        except IntegrityError as e:
+            logger.warning(f"Duplicate article rejected: {str(e)}")
+            db.session.rollback()
+            flash('Another article already exists for that week.', 'error')
+            return render_template('admin/article_form.html')
         except Exception as e:
             logger.error(f"Error creating new article: {str(e)}")
             db.session.rollback()
@@ -450,6 +456,11 @@ def edit_article(article_id: int) -> Union[str, Response]:
             logger.error(f"Invalid date format in article edit: {str(e)}")
             flash('Invalid date format. Please use YYYY-MM-DD format.', 'error')
             return render_template('admin/article_form.html', article=article)
+        except IntegrityError as e:
+            logger.warning(f"Duplicate article rejected for {article_id}: {str(e)}")
+            db.session.rollback()
+            flash('Another article already exists for that week or uses that custom URL.', 'error')
+            return render_template('admin/article_form.html', article=article)
         except Exception as e:
             logger.error(f"Error updating article {article_id}: {str(e)}")
             db.session.rollback()
@@ -504,7 +515,7 @@ def utility_processor() -> dict:
         # Get the Sunday of the week
         sunday = monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
 
-        logger.debug(f"Formatting date - Original: {date}, Monday: {monday}, Sunday: {sunday}")
+        logger.debug("Formatting date - Original: %s, Monday: %s, Sunday: %s", date, monday, sunday)
 
         # Format as "Week of Month Day - Month Day, Year"
         if monday.month == sunday.month:
@@ -586,26 +597,18 @@ def generate_single_article():
         logger.info(f"Article generation request - Environment: Production={is_production}, "
                    f"Deployment={is_deployment}, Database configured={has_db_url}")
 
-        # Try to generate an article for the specified date
-        article = generation_service.generate_article(generation_date)
+        # Generation takes tens of seconds, so it runs in the background and the
+        # dashboard polls /api/generation-status
+        outcome, reason = generation_service.start_generation(generation_date)
 
-        if article:
+        if outcome is GenerationStart.STARTED:
             flash('Article generation started. Check the status in the dashboard.', 'success')
-            logger.info(f"Started generating article with ID: {article.id} for date {generation_date}")
+            logger.info(f"Started generating article for date {generation_date}")
+        elif outcome is GenerationStart.BUSY:
+            flash('Another article is currently being generated. Please wait.', 'warning')
         else:
-            status = generation_service.get_generation_status()
-            if status.get("is_generating"):
-                flash('Another article is currently being generated. Please wait.', 'warning')
-            else:
-                error_details = []
-                if not os.environ.get('DATABASE_URL'):
-                    error_details.append("Database URL not configured")
-                if status.get("error"):
-                    error_details.append(status.get("error"))
-
-                error_message = " | ".join(error_details) if error_details else "Unknown error occurred"
-                flash(f'Failed to start article generation: {error_message}', 'error')
-                logger.error(f"Article generation failed: {error_message}")
+            flash(f'Failed to start article generation: {reason}', 'error')
+            logger.error(f"Article generation failed to start: {reason}")
 
     except Exception as e:
         logger.error(f"Error starting article generation: {str(e)}", exc_info=True)
@@ -6,10 +6,9 @@ import pytz # Added import for timezone support
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import app, db
-from services.github_service import GitHubService
-from services.content_service import ContentService
-from models import Article, Source
+from app import app
+from services.new_article_generation_service import NewArticleGenerationService
+from models import Article
 
 # Setup logging
 logging.basicConfig(
@@ -58,8 +57,13 @@ def get_missing_weeks():
 
         return missing_weeks
 
-def generate_sample_articles():
-    """Generate articles for missing weeks"""
+def generate_sample_articles(use_batch=False):
+    """Generate articles for missing weeks
+
+    Args:
+        use_batch: Send all weeks as one OpenAI Batch API job (half the cost,
+            up to 24h turnaround) instead of concurrent live requests
+    """
     try:
         # Check if we're in production environment
         is_production = os.environ.get('REPL_ENVIRONMENT') == 'production'
@@ -79,46 +83,15 @@ def generate_sample_articles():
 
         logger.info(f"Found {len(missing_weeks)} weeks needing articles")
 
-        # Initialize services
+        # Weeks are generated concurrently, each from its own week's GitHub content
         logger.info("Initializing services...")
-        github_service = GitHubService()
-        content_service = ContentService()
-
-        # Get real GitHub content
-        logger.info("Fetching GitHub content...")
-        github_content = github_service.fetch_recent_content()
-
-        if not github_content:
-            logger.error("No content fetched from GitHub")
-            return False
-
-        logger.info(f"Successfully fetched {len(github_content)} items from GitHub")
-
-        success_count = 0
+        generation_service = NewArticleGenerationService()
 
         with app.app_context():
-            for monday in missing_weeks:
-                try:
-                    logger.info(f"=== Generating article for week {monday.strftime('%Y-%m-%d')} ===")
-
-                    # Add delay between article generations
-                    if success_count > 0:
-                        delay = 30  # 30 seconds between generations
-                        logger.info(f"Waiting {delay} seconds before generating next article...")
-                        import time
-                        time.sleep(delay)
-
-                    # Generate article
-                    article = content_service.generate_weekly_summary(github_content, monday)
-
-                    if article:
-                        success_count += 1
-                        logger.info(f"Generated article for week of {monday.strftime('%Y-%m-%d')}: {article.title}")
-
-                except Exception as e:
-                    logger.error(f"Error generating article for week of {monday.strftime('%Y-%m-%d')}: {str(e)}")
-                    db.session.rollback()
-                    continue
+            if use_batch:
+                success_count = len(generation_service.generate_articles_bulk(missing_weeks))
+            else:
+                success_count = len(generation_service.generate_many(missing_weeks))
 
         logger.info(f"=== Sample Data Generation Complete ===")
         logger.info(f"Successfully generated {success_count} articles")
@@ -136,7 +109,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     print("\n=== Starting Sample Data Generation Script ===\n")
-    success = generate_sample_articles()
+    success = generate_sample_articles(use_batch='--batch' in sys.argv[1:])
     exit_code = 0 if success else 1
     print(f"\n=== Sample Data Generation {'Succeeded' if success else 'Failed'} ===\n")
     sys.exit(exit_code)
\ No newline at end of file
@@ -3,6 +3,7 @@ import os
 import logging
 from datetime import datetime, timedelta
 import pytz
+from sqlalchemy import insert
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -93,16 +94,17 @@ def regenerate_article(article, github_service, content_service):
         # Delete old sources
         Source.query.filter_by(article_id=article.id).delete()
 
-        # Add new sources
-        for item in github_content:
-            source = Source(
-                url=item['url'],
-                type=item['type'],
-                title=item.get('title', ''),
-                repository=item['repository'],
-                article=article
-            )
-            db.session.add(source)
+        # Add new sources in one executemany INSERT
+        db.session.execute(insert(Source), [
+            {
+                'url': item['url'],
+                'type': item['type'],
+                'title': item.get('title', ''),
+                'repository': item['repository'],
+                'article_id': article.id
+            }
+            for item in github_content
+        ])
 
         db.session.commit()
         logger.info(f"Successfully regenerated article: {article.title}")
@@ -0,0 +1,38 @@
+import logging
+import threading
+from functools import lru_cache
+from typing import Callable, Hashable
+
+import requests
+from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def shared_session(key: Hashable, configure: Callable[[requests.Session], None]) -> requests.Session:
+    """Return the process-wide requests.Session for key, creating it on first use.
+
+    Services are built per request and per scheduler run; sharing their sessions
+    keeps pooled keep-alive connections instead of a new TLS handshake each time.
+
+    Args:
+        key: Identifies the session, including anything its configuration depends on
+        configure: Sets headers and adapters on a newly created session
+    """
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            configure(session)
+            _sessions[key] = session
+            logger.debug(f"Created shared HTTP session for {key!r}")
+        return session
+
+
+@lru_cache(maxsize=None)
+def shared_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for an API key."""
+    return OpenAI(api_key=api_key)
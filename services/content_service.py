@@ -1,23 +1,104 @@
+import html
 import json
 import logging
 import os
 import random
+import re
 import time
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Union
 
-import pytz
-from openai import OpenAI, RateLimitError
+import httpx
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
 from app import db
 from models import Article, Source
+from services.clients import shared_openai_client
 from services.forum_service import ForumService
 
 logger = logging.getLogger(__name__)
 
+# Section headings at the start of a line, tolerating markdown emphasis, heading
+# marks and list numbering ("3. Repository Updates:"), as the prompt lists them
+_SECTION_RE = re.compile(
+    r'^[ \t#*]*(?:\d+[.)][ \t]*)?\**(Repository Updates|Technical Highlights|Next Steps)\**:\**[ \t]*',
+    re.MULTILINE
+)
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+
+# Errors worth another attempt. APITimeoutError subclasses APIConnectionError;
+# a stream cut off mid-response surfaces as a raw httpx transport error.
+_TRANSIENT_OPENAI_ERRORS = (RateLimitError, APIConnectionError, InternalServerError, httpx.TransportError)
+
+_ARTICLE_SYSTEM_PROMPT = """You are a technical writer specializing in blockchain technology documentation.
+Your task is to create comprehensive weekly summaries of Ethereum development that balance technical accuracy with accessibility.
+
+Most important rules:
+1. Use plain language that anyone can understand
+2. Explain complex ideas in simple terms
+3. Focus on real-world impact and benefits
+4. Avoid technical jargon in titles
+5. Make concepts accessible to regular users
+
+Title requirements:
+- Create simple, clear titles that describe the main improvements
+- Write titles that anyone can understand
+- Combine multiple key changes in plain language
+- DO NOT include dates or week references
+- DO NOT use technical terms, parentheses, or quotation marks
+- Example: "Making Smart Contracts Better and Network Updates"
+- Example: "Network Speed Improvements and Better Security"
+
+Required sections:
+1. A clear, simple title following the above format
+2. A detailed overview (at least 700 characters)
+3. Repository updates (start with 'Repository Updates:')
+4. Technical highlights (start with 'Technical Highlights:')
+5. Next Steps (start with 'Next Steps:')"""
+
+_ARTICLE_SYSTEM_MESSAGE = {"role": "system", "content": _ARTICLE_SYSTEM_PROMPT}
+
+_ARTICLE_USER_TEMPLATE = """Create a simple, easy-to-understand update about Ethereum development for the week of {date}.
+Remember:
+- Create clear, simple titles without technical terms
+- Explain the main improvements in plain language
+- Avoid technical jargon and quotation marks in titles
+- Use everyday language
+- Make complex ideas easy to understand
+- Focus on real-world benefits
+- Keep explanations clear and simple
+- Include clear 'Repository Updates:', 'Technical Highlights:', and 'Next Steps:' sections
+
+Here are the technical updates to analyze:
+{payload}"""
+
+
 class ContentService:
     """Service for generating and managing article content using OpenAI."""
 
+    # Content item type -> key of its list in organize_content_by_repository
+    _TYPE_BUCKETS = {'issue': 'issues', 'commit': 'commits'}
+
+    # HTML fragments for the article body; values are escaped before formatting
+    _TPL_ARTICLE_OPEN = (
+        '<article class="ethereum-article">'
+        '<div class="overview-section mb-4"><div class="overview-content">{overview}</div></div>'
+    )
+    _TPL_SECTION_OPEN = '<div class="{css} mb-4"><h2 class="section-title">{title}</h2>'
+    _TPL_SECTION_CLOSE = '</div>'
+    _TPL_LIST_ITEM = '<li>{}</li>'
+    _TPL_REPO_NAME = '<h3 class="repository-name">{}</h3>'
+    _TPL_REPO_UPDATE = (
+        '<div class="repository-update mb-3">{name}'
+        '<div class="update-summary"><p>{summary}</p></div></div>'
+    )
+    _TPL_HIGHLIGHT_TITLE = '<h3>{}</h3>'
+    _TPL_HIGHLIGHT_IMPACT = '<div class="highlight-impact"><strong>Impact:</strong><p>{}</p></div>'
+    _TPL_HIGHLIGHT = '<div class="highlight mb-3">{title}<p>{description}</p>{impact}</div>'
+
     def __init__(self):
         """Initialize the ContentService with OpenAI client and forum service."""
         try:
@@ -25,8 +106,11 @@ class ContentService:
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable is not set")
 
-            self.openai = OpenAI(api_key=api_key)
-            self.model = "gpt-4"  # Using stable model
+            self.openai = shared_openai_client(api_key)
+            # Article generation dominates latency; smaller model and output budget by default
+            self.model = os.environ.get('OPENAI_ARTICLE_MODEL', 'gpt-4o-mini')
+            self.max_output_tokens = int(os.environ.get('OPENAI_ARTICLE_MAX_TOKENS', '1200'))
+            self.temperature = float(os.environ.get('OPENAI_ARTICLE_TEMPERATURE', '0.3'))
             self.max_retries = 5
             self.base_delay = 2
             self.max_delay = 60
@@ -46,28 +130,39 @@ class ContentService:
         return delay
 
     def _retry_with_exponential_backoff(self, func, *args, **kwargs):
-        """Execute a function with improved exponential backoff retry logic."""
-        last_exception = None
+        """Execute a function, retrying transient OpenAI errors with exponential backoff.
+
+        Rate limits, timeouts, dropped connections and 5xx responses are retried;
+        anything else (bad request, auth, a parsing bug) fails on the first attempt.
+        """
         for attempt in range(self.max_retries):
             try:
                 return func(*args, **kwargs)
-            except RateLimitError as e:
-                last_exception = e
+            except _TRANSIENT_OPENAI_ERRORS as e:
                 if attempt == self.max_retries - 1:
                     logger.error(f"Max retries ({self.max_retries}) exceeded: {str(e)}")
                     raise
                 delay = self._get_delay(attempt)
-                logger.warning(f"Rate limit hit, retrying in {delay:.2f} seconds (attempt {attempt + 1}/{self.max_retries})")
-                time.sleep(delay)
-            except Exception as e:
-                logger.error(f"Unexpected error in attempt {attempt + 1}: {str(e)}")
-                last_exception = e
-                if attempt == self.max_retries - 1:
-                    raise last_exception
-                delay = self._get_delay(attempt)
-                logger.info(f"Retrying in {delay:.2f} seconds...")
+                logger.warning(f"{type(e).__name__} from OpenAI, retrying in {delay:.2f} seconds "
+                               f"(attempt {attempt + 1}/{self.max_retries})")
                 time.sleep(delay)
 
+    def _stream_completion(self, **kwargs) -> str:
+        """Run a chat completion with streaming and return the accumulated text.
+
+        Tokens arrive as they are generated, so a long article keeps the
+        connection active instead of idling until the whole response is ready.
+        A stream that breaks part way raises, letting the caller retry it.
+        """
+        stream = self.openai.chat.completions.create(stream=True, **kwargs)
+        parts = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                if len(parts) == 1:
+                    logger.info("Receiving streamed response from OpenAI API")
+        return ''.join(parts)
+
     def organize_content_by_repository(self, github_content: List[Dict]) -> Dict[str, Dict]:
         """Organize GitHub content by repository and type.
 
@@ -77,22 +172,15 @@ class ContentService:
         Returns:
             Dictionary organizing content by repository
         """
-        repo_content = {}
+        repo_content = defaultdict(lambda: {'issues': [], 'commits': []})
         for item in github_content:
-            repo = item['repository']
-            if repo not in repo_content:
-                repo_content[repo] = {
-                    'issues': [],
-                    'commits': [],
-                    'repository': repo
-                }
-
-            if item['type'] == 'issue':
-                repo_content[repo]['issues'].append(item)
-            elif item['type'] == 'commit':
-                repo_content[repo]['commits'].append(item)
+            bucket = self._TYPE_BUCKETS.get(item['type'])
+            if bucket:
+                repo_content[item['repository']][bucket].append(item)
 
-        return repo_content
+        for repo, content in repo_content.items():
+            content['repository'] = repo
+        return dict(repo_content)
 
     def _clean_title(self, title: str) -> str:
         """Clean and format the article title.
@@ -118,48 +206,36 @@ class ContentService:
         Returns:
             Dictionary containing extracted sections
         """
-        parts = content.split('\n\n')
-        title = self._clean_title(parts[0])
+        matches = list(_SECTION_RE.finditer(content))
+        preamble = content[:matches[0].start()] if matches else content
+        preamble_parts = [p.strip() for p in _PARAGRAPH_RE.split(preamble.strip())]
+        title = self._clean_title(preamble_parts[0])
 
         brief_summary = ''
-        repo_updates = []
-        tech_highlights = []
-        next_steps = []
-        current_section = None
-
-        for part in parts[1:]:
-            part = part.strip()
-            if not part:
-                continue
-
-            if 'Repository Updates:' in part:
-                current_section = 'repo'
-                part = part.replace('Repository Updates:', '').strip()
-            elif 'Technical Highlights:' in part:
-                current_section = 'tech'
-                part = part.replace('Technical Highlights:', '').strip()
-            elif 'Next Steps:' in part:
-                current_section = 'next'
-                part = part.replace('Next Steps:', '').strip()
-
-            if current_section == 'repo' and part:
-                repo_updates.append(part)
-            elif current_section == 'tech' and part:
-                tech_highlights.append(part)
-            elif current_section == 'next' and part:
-                if part.startswith('- '):
-                    next_steps.extend([step.strip() for step in part.split('\n')])
-                else:
-                    next_steps.append(part)
-            elif not current_section and len(brief_summary) < 700:
+        for part in preamble_parts[1:]:
+            if part and len(brief_summary) < 700:
                 brief_summary += ' ' + part
 
+        sections = {'Repository Updates': [], 'Technical Highlights': [], 'Next Steps': []}
+        for i, match in enumerate(matches):
+            body_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            body = content[match.end():body_end]
+            items = sections[match.group(1)]
+            for part in _PARAGRAPH_RE.split(body.strip()):
+                part = part.strip()
+                if not part:
+                    continue
+                if match.group(1) == 'Next Steps' and part.startswith('- '):
+                    items.extend(step.strip() for step in part.split('\n'))
+                else:
+                    items.append(part)
+
         return {
             'title': title,
             'brief_summary': brief_summary.strip(),
-            'repo_updates': repo_updates,
-            'tech_highlights': tech_highlights,
-            'next_steps': next_steps
+            'repo_updates': sections['Repository Updates'],
+            'tech_highlights': sections['Technical Highlights'],
+            'next_steps': sections['Next Steps']
         }
 
     def _generate_overview_summary(self, content: Dict) -> str:
@@ -195,7 +271,7 @@ class ContentService:
                 self.openai.chat.completions.create,
                 model=self.model,
                 messages=messages,
-                temperature=0.7,
+                temperature=self.temperature,
                 max_tokens=500
             )
 
@@ -217,45 +293,30 @@ class ContentService:
             # Generate overview summary
             overview_summary = self._generate_overview_summary(summary_data)
 
-            article_html = f"""
-                <article class="ethereum-article">
-                    <div class="overview-section mb-4">
-                        <div class="overview-content">
-                            {overview_summary}
-                        </div>
-                    </div>
-            """
+            parts = [self._TPL_ARTICLE_OPEN.format(overview=html.escape(overview_summary))]
 
             # Repository updates section
             if summary_data.get('repository_updates'):
-                article_html += f"""
-                    <div class="repository-updates mb-4">
-                        <h2 class="section-title">Repository Updates</h2>
-                        {self._format_repository_updates(summary_data.get('repository_updates', []))}
-                    </div>
-                """
+                parts.append(self._TPL_SECTION_OPEN.format(css='repository-updates', title='Repository Updates'))
+                parts.append(self._format_repository_updates(summary_data['repository_updates']))
+                parts.append(self._TPL_SECTION_CLOSE)
 
             # Technical highlights section
             if summary_data.get('technical_highlights'):
-                article_html += f"""
-                    <div class="technical-highlights mb-4">
-                        <h2 class="section-title">Technical Highlights</h2>
-                        {self._format_technical_highlights(summary_data.get('technical_highlights', []))}
-                    </div>
-                """
+                parts.append(self._TPL_SECTION_OPEN.format(css='technical-highlights', title='Technical Highlights'))
+                parts.append(self._format_technical_highlights(summary_data['technical_highlights']))
+                parts.append(self._TPL_SECTION_CLOSE)
 
             # Next steps section
             if summary_data.get('next_steps'):
-                article_html += f"""
-                    <div class="next-steps mb-4">
-                        <h2 class="section-title">Next Steps</h2>
-                        <ul>
-                            {''.join(f"<li>{step}</li>" for step in summary_data.get('next_steps', []))}
-                        </ul>
-                    </div>
-                """
-
-            article_html += "</article>"
+                parts.append(self._TPL_SECTION_OPEN.format(css='next-steps', title='Next Steps'))
+                parts.append('<ul>')
+                parts.extend(self._TPL_LIST_ITEM.format(html.escape(step)) for step in summary_data['next_steps'])
+                parts.append('</ul>')
+                parts.append(self._TPL_SECTION_CLOSE)
+
+            parts.append('</article>')
+            article_html = ''.join(parts)
             logger.info(f"Generated article HTML (length: {len(article_html)})")
             return article_html
 
@@ -272,27 +333,16 @@ class ContentService:
         Returns:
             Formatted HTML for updates section
         """
-        formatted_updates = []
+        parts = []
         for update in updates:
             if isinstance(update, str):
-                update_html = f"""
-                    <div class="repository-update mb-3">
-                        <div class="update-summary">
-                            <p>{update}</p>
-                        </div>
-                    </div>
-                """
-            else:
-                update_html = f"""
-                    <div class="repository-update mb-3">
-                        {f'<h3 class="repository-name">{update.get("repository")}</h3>' if update.get("repository") else ''}
-                        <div class="update-summary">
-                            <p>{update.get('summary', '')}</p>
-                        </div>
-                    </div>
-                """
-            formatted_updates.append(update_html)
-        return '\n'.join(formatted_updates)
+                update = {'summary': update}
+            repository = update.get('repository')
+            parts.append(self._TPL_REPO_UPDATE.format(
+                name=self._TPL_REPO_NAME.format(html.escape(repository)) if repository else '',
+                summary=html.escape(str(update.get('summary', '')))
+            ))
+        return '\n'.join(parts)
 
     def _format_technical_highlights(self, highlights: List[Union[str, Dict]]) -> str:
         """Format technical highlights section.
@@ -303,27 +353,66 @@ class ContentService:
         Returns:
             Formatted HTML for highlights section
         """
-        formatted_highlights = []
+        parts = []
         for highlight in highlights:
             if isinstance(highlight, str):
-                highlight_html = f"""
-                    <div class="highlight mb-3">
-                        <p>{highlight}</p>
-                    </div>
-                """
-            else:
-                highlight_html = f"""
-                    <div class="highlight mb-3">
-                        {f'<h3>{highlight.get("title")}</h3>' if highlight.get("title") else ''}
-                        <p>{highlight.get('description', '')}</p>
-                        {f'<div class="highlight-impact"><strong>Impact:</strong><p>{highlight.get("impact")}</p></div>' if highlight.get("impact") else ''}
-                    </div>
-                """
-            formatted_highlights.append(highlight_html)
-        return '\n'.join(formatted_highlights)
-
-    def generate_weekly_summary(self, github_content: List[Dict], publication_date: Optional[datetime] = None) -> Optional[Article]:
-        """Generate a weekly summary article from GitHub content."""
+                highlight = {'description': highlight}
+            title = highlight.get('title')
+            impact = highlight.get('impact')
+            parts.append(self._TPL_HIGHLIGHT.format(
+                title=self._TPL_HIGHLIGHT_TITLE.format(html.escape(title)) if title else '',
+                description=html.escape(str(highlight.get('description', ''))),
+                impact=self._TPL_HIGHLIGHT_IMPACT.format(html.escape(impact)) if impact else ''
+            ))
+        return '\n'.join(parts)
+
+    def build_article_messages(self, github_content: List[Dict], publication_date: datetime) -> Optional[List[Dict]]:
+        """Build the chat messages asking for a week's article.
+
+        Returns:
+            The messages, or None if there is no repository content to summarize
+        """
+        repo_content = self.organize_content_by_repository(github_content)
+        if not repo_content:
+            return None
+
+        # Create repository summaries
+        repo_summaries = []
+        for repo, content in repo_content.items():
+            summary = {
+                'repository': repo,
+                'total_issues': len(content['issues']),
+                'total_commits': len(content['commits']),
+                'sample_issues': [{'title': issue['title'], 'url': issue['url']} for issue in content['issues'][:3]],
+                'sample_commits': [{'title': commit['title'], 'url': commit['url']} for commit in content['commits'][:3]]
+            }
+            repo_summaries.append(summary)
+
+        logger.info(f"Generated summaries for {len(repo_summaries)} repositories")
+
+        return [
+            _ARTICLE_SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": _ARTICLE_USER_TEMPLATE.format(
+                    date=publication_date.strftime('%Y-%m-%d'),
+                    payload=json.dumps(repo_summaries, separators=(',', ':'), default=str)
+                )
+            }
+        ]
+
+    def generate_weekly_summary(self, github_content: List[Dict], publication_date: Optional[datetime] = None,
+                                forum_summary: Optional[str] = None,
+                                completion: Optional[str] = None) -> Optional[Article]:
+        """Generate a weekly summary article from GitHub content.
+
+        Args:
+            github_content: Content items from GitHubService
+            publication_date: Monday of the article's week
+            forum_summary: Forum summary HTML fetched by the caller; fetched here if omitted
+            completion: Model output already produced for build_article_messages (e.g. by
+                a batch job); the OpenAI call is skipped when given
+        """
         if not github_content:
             logger.error("No GitHub content provided for summary generation")
             raise ValueError("GitHub content is required for summary generation")
@@ -334,7 +423,7 @@ class ContentService:
             return None
 
         try:
-            current_date = datetime.now(pytz.UTC)
+            current_date = datetime.now(timezone.utc)
 
             # Enhanced logging for publication date handling
             logger.info(f"Starting article generation for date: {publication_date}")
@@ -344,13 +433,12 @@ class ContentService:
                 if not isinstance(publication_date, datetime):
                     publication_date = datetime.fromisoformat(str(publication_date))
                 if publication_date.tzinfo is None:
-                    publication_date = pytz.UTC.localize(publication_date)
+                    publication_date = publication_date.replace(tzinfo=timezone.utc)
             else:
                 # Only allow creation of articles for past Mondays
                 days_since_monday = current_date.weekday()
                 publication_date = current_date - timedelta(days=days_since_monday)
                 publication_date = publication_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                publication_date = pytz.UTC.localize(publication_date)
 
                 # If it's not Monday and we're trying to create an article for the current week, return None
                 if current_date.weekday() != 0 and publication_date >= current_date.replace(hour=0, minute=0, second=0, microsecond=0):
@@ -372,10 +460,10 @@ class ContentService:
                 return existing_article
 
             # Get forum discussions summary with error handling
-            forum_summary = None
             forum_error = None
             try:
-                forum_summary = self.forum_service.get_weekly_forum_summary(publication_date)
+                if forum_summary is None:
+                    forum_summary = self.forum_service.get_weekly_forum_summary(publication_date)
                 if not forum_summary:
                     forum_error = "No forum discussions found for this week"
                     logger.warning(forum_error)
@@ -383,91 +471,32 @@ class ContentService:
                 forum_error = f"Error fetching forum discussions: {str(e)}"
                 logger.error(forum_error)
 
-            repo_content = self.organize_content_by_repository(github_content)
-            if not repo_content:
+            messages = self.build_article_messages(github_content, publication_date)
+            if not messages:
                 logger.warning("No content found to summarize")
                 return None
 
-            # Create repository summaries
-            repo_summaries = []
-            for repo, content in repo_content.items():
-                summary = {
-                    'repository': repo,
-                    'total_issues': len(content['issues']),
-                    'total_commits': len(content['commits']),
-                    'sample_issues': [{'title': issue['title'], 'url': issue['url']} for issue in content['issues'][:3]],
-                    'sample_commits': [{'title': commit['title'], 'url': commit['url']} for commit in content['commits'][:3]]
-                }
-                repo_summaries.append(summary)
-
-            logger.info(f"Generated summaries for {len(repo_summaries)} repositories")
-
-            # Generate article content using OpenAI
-            messages = [
-                {
-                    "role": "system",
-                    "content": """You are a technical writer specializing in blockchain technology documentation. 
-                    Your task is to create comprehensive weekly summaries of Ethereum development that balance technical accuracy with accessibility.
-                    
-                    Most important rules:
-                    1. Use plain language that anyone can understand
-                    2. Explain complex ideas in simple terms
-                    3. Focus on real-world impact and benefits
-                    4. Avoid technical jargon in titles
-                    5. Make concepts accessible to regular users
-                    
-                    Title requirements:
-                    - Create simple, clear titles that describe the main improvements
-                    - Write titles that anyone can understand
-                    - Combine multiple key changes in plain language
-                    - DO NOT include dates or week references
-                    - DO NOT use technical terms, parentheses, or quotation marks
-                    - Example: "Making Smart Contracts Better and Network Updates"
-                    - Example: "Network Speed Improvements and Better Security"
-                    
-                    Required sections:
-                    1. A clear, simple title following the above format
-                    2. A detailed overview (at least 700 characters)
-                    3. Repository updates (start with 'Repository Updates:')
-                    4. Technical highlights (start with 'Technical Highlights:')
-                    5. Next Steps (start with 'Next Steps:')"""
-                },
-                {
-                    "role": "user",
-                    "content": f"""Create a simple, easy-to-understand update about Ethereum development for the week of {publication_date.strftime('%Y-%m-%d')}.
-                    Remember:
-                    - Create clear, simple titles without technical terms
-                    - Explain the main improvements in plain language
-                    - Avoid technical jargon and quotation marks in titles
-                    - Use everyday language
-                    - Make complex ideas easy to understand
-                    - Focus on real-world benefits
-                    - Keep explanations clear and simple
-                    - Include clear 'Repository Updates:', 'Technical Highlights:', and 'Next Steps:' sections
-                    
-                    Here are the technical updates to analyze:
-                    {json.dumps(repo_summaries, indent=2)}"""
-                }
-            ]
-
-            logger.info("Sending request to OpenAI API...")
-            response = self._retry_with_exponential_backoff(
-                self.openai.chat.completions.create,
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2000
-            )
+            if completion is None:
+                logger.info("Sending request to OpenAI API...")
+                content = self._retry_with_exponential_backoff(
+                    self._stream_completion,
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_output_tokens
+                )
+            else:
+                content = completion
 
-            if not response or not hasattr(response, 'choices') or not response.choices:
+            if not content:
                 raise ValueError("Invalid response from OpenAI API")
 
             logger.info("Received response from OpenAI API")
-            content = response.choices[0].message.content
             sections = self._extract_content_sections(content)
 
             # Log sections for debugging
-            logger.debug(f"Extracted sections: {json.dumps({k: v[:100] + '...' if isinstance(v, str) else v for k, v in sections.items()})}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Extracted sections: %s", json.dumps({k: v[:100] + '...' if isinstance(v, str) else v for k, v in sections.items()}))
 
             # Format the content as HTML with the added forum summary or error message
             article_content = self._format_article_content({
@@ -490,23 +519,38 @@ class ContentService:
             )
             article.generate_slug()
 
-            # Add sources
-            for item in github_content:
-                source = Source(
-                    url=item['url'],
-                    type=item['type'],
-                    title=item.get('title', ''),
-                    repository=item['repository'],
-                    article=article
-                )
-                db.session.add(source)
-
             db.session.add(article)
+            db.session.flush()  # Assigns article.id for the sources
+
+            # Add sources in one executemany INSERT rather than one per object
+            db.session.execute(insert(Source), [
+                {
+                    'url': item['url'],
+                    'type': item['type'],
+                    'title': item.get('title', ''),
+                    'repository': item['repository'],
+                    'article_id': article.id
+                }
+                for item in github_content
+            ])
             db.session.commit()
             logger.info(f"Successfully created article: {article.title}")
 
             return article
 
+        except IntegrityError as e:
+            # Another worker committed this week's article first; hand back theirs
+            db.session.rollback()
+            existing = Article.query.filter(
+                Article.publication_date >= week_start,
+                Article.publication_date < week_end
+            ).first()
+            if existing:
+                logger.warning(f"Article for week of {week_start:%Y-%m-%d} was created concurrently, using article {existing.id}")
+                return existing
+            logger.error(f"Error in generate_weekly_summary: {str(e)}", exc_info=True)
+            raise
+
         except Exception as e:
             logger.error(f"Error in generate_weekly_summary: {str(e)}", exc_info=True)
             db.session.rollback()
@@ -0,0 +1,53 @@
+import logging
+import os
+import shelve
+import time
+from typing import Any, Optional
+
+from services.http_cache import path_lock
+
+logger = logging.getLogger(__name__)
+
+
+class TTLDiskCache:
+    """Disk-backed key/value store whose entries expire after a fixed age."""
+
+    def __init__(self, name: str, ttl: float, cache_dir: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            name: File name of the shelve database
+            ttl: Seconds an entry stays valid
+            cache_dir: Directory holding the database (default: instance/)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.getcwd(), 'instance')
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, name)
+        self.ttl = ttl
+        # Shared with every instance on this file; shelve tolerates no concurrent writers
+        self._lock = path_lock(self.path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under key, or None if missing or expired."""
+        try:
+            with self._lock, shelve.open(self.path) as db:
+                entry = db.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read cache {self.path} for {key}: {str(e)}")
+            return None
+
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.time() - stored_at > self.ttl:
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value under key."""
+        try:
+            with self._lock, shelve.open(self.path) as db:
+                db[key] = (value, time.time())
+        except Exception as e:
+            logger.warning(f"Failed to write cache {self.path} for {key}: {str(e)}")
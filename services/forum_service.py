@@ -1,22 +1,164 @@
+import asyncio
+import hashlib
+import html
+import io
+import json
 import logging
+import random
 import re
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Union
-from bs4 import BeautifulSoup
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple, Union
+from lxml import html as lxml_html
 import requests
+from requests.adapters import HTTPAdapter
 import pytz
-from openai import OpenAI
+from openai import AsyncOpenAI
 import os
+from urllib.parse import urlparse
+
+try:
+    import ijson  # Incremental parsing of large topic payloads
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Faster decoding of topic list payloads
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken  # Token-accurate prompt budgeting
+except ImportError:
+    tiktoken = None
+
+from services.clients import shared_openai_client, shared_session
+from services.http_cache import ConditionalRequestCache
+from services.rate_limiter import TokenBucket
+from services.summary_cache import SemanticSummaryCache
 
 logger = logging.getLogger(__name__)
 
+_SOURCE_SYSTEM_PROMPT = """You are an expert in Ethereum protocol discussions.
+Summarize the key points from {source} forum discussions in a clear,
+accessible way. Focus on:
+1. Main topics discussed
+2. Important decisions or consensus reached
+3. Notable technical proposals
+Keep the summary concise and use plain language.
+
+Format your response as a clean HTML section with:
+- A section header for {source}
+- Key points in bullet points
+- No full HTML document tags (html, head, body)
+- Use div with appropriate classes for styling"""
+
+_RAW_HEADER = """
+        <div class="forum-discussion-summary">
+            <div class="alert alert-info">
+                Summaries are temporarily unavailable. Showing raw discussion content.
+            </div>
+"""
+
+_RAW_TEMPLATE = """
+                <div class="forum-discussion-item">
+                    <h4>{title}</h4>
+                    <p>Source: {source}</p>
+                    <p>Date: {date}</p>
+                    <div class="forum-content">{content}...</div>
+                    <a href="{url}" target="_blank" class="forum-link">
+                        Read more →
+                    </a>
+                </div>
+"""
+
+_RAW_FOOTER = """
+        </div>
+"""
+
+_NO_DISCUSSIONS_PAGE = '<div class="alert alert-info">No forum discussions found for this week.</div>'
+
+_ERROR_PAGE = '<div class="alert alert-danger">An error occurred while generating the forum summary. Please check the logs for details.</div>'
+
+
+_TLDR_SYSTEM_PROMPT = """You condense Ethereum forum posts.
+Reply with a two-sentence plain-text TL;DR of the post: the proposal or
+question raised and any conclusion reached. No markup."""
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Optional[Any]:
+    """Return the GPT-4 tokenizer, or None when tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model('gpt-4')
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding: {str(e)}")
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> Tuple[str, int]:
+    """Trim text to at most max_tokens tokens.
+
+    Returns the trimmed text and its token count. Without tiktoken, tokens
+    are approximated as four characters each.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        text = text[:max_tokens * 4]
+        return text, (len(text) + 3) // 4
+
+    tokens = encoding.encode(text)
+    if len(tokens) > max_tokens:
+        tokens = tokens[:max_tokens]
+        text = encoding.decode(tokens)
+    return text, len(tokens)
+
+_REQUIRED_TOPIC_FIELDS = ('created_at', 'id', 'title')
+
+# Raw HTML kept before text extraction; far more than any preview needs
+_MAX_HTML_CHARS = 20000
+
+
+def _extract_text(content: str, limit: int) -> str:
+    """Extract the stripped text of an HTML fragment, like get_text(strip=True).
+
+    Traversal stops once more than `limit` characters have been collected, so
+    long posts are not walked in full when only a preview is needed. Callers
+    can compare the result length against `limit` to detect truncation.
+    """
+    if not content or not content.strip():
+        return ''
+
+    # Plain text without markup or entities needs no parse
+    if '<' not in content and '&' not in content:
+        return content.strip()
+
+    parts = []
+    total = 0
+    # Bound parser work on very long posts; lxml recovers from the cut-off markup
+    for text in lxml_html.fromstring(content[:_MAX_HTML_CHARS]).itertext():
+        text = text.strip()
+        if text:
+            parts.append(text)
+            total += len(text)
+            if total > limit:
+                break
+    return ''.join(parts)
+
+
 class ForumService:
     """Service for fetching and processing Ethereum forum discussions."""
 
     def __init__(self):
         """Initialize the ForumService."""
-        self.forum_base_url = "https://ethereum-magicians.org/c/protocol-calls/63.json"
+        self.magicians_base_url = "https://ethereum-magicians.org"
+        self.forum_base_url = f"{self.magicians_base_url}/c/protocol-calls/63.json"
         self.ethresear_base_url = "https://ethresear.ch"
         self.ethresear_categories = [
             "latest.json",  # Get latest posts across all categories
@@ -24,17 +166,47 @@ class ForumService:
             "c/rollups/45.json"  # Updated category for L2/rollups
         ]
         self.model = "gpt-4"
+        self.embedding_model = "text-embedding-3-small"  # Used for the semantic summary cache
+        self.tldr_model = "gpt-4o-mini"  # Condenses long discussions before the final summary
+        self.max_concurrent_tldrs = 5
+        self.max_concurrent_summaries = 4  # Concurrent summary calls in multi-week runs
+        self.tldr_min_chars = 1500  # Shorter bodies go into the summary prompt as they are
+        self.prompt_token_budget = 6000  # Input tokens for a summary request
+        self.max_tokens_per_discussion = 250
+        self.max_body_chars = self.max_tokens_per_discussion * 8  # Opening post text kept for the prompt
         self.max_retries = 3  # Reduced retries to avoid long waits
-        self.base_delay = 20  # Increased base delay for rate limiting
-        self.max_delay = 60
-        self.last_api_call = 0
-        self.min_time_between_calls = 10  # Increased minimum time between calls
-
-        # Initialize session with custom headers
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; EthDevWatch/1.0; +https://ethdevwatch.replit.app)'
-        })
+        self.base_delay = 0.1  # Lower bound for jittered backoff
+        self.max_delay = 30
+        # Each forum host gets its own request budget; OpenAI is limited separately
+        self._limiters = {
+            'ethereum-magicians.org': TokenBucket(10, 1),
+            'ethresear.ch': TokenBucket(10, 1),
+        }
+        self._openai_limiter = TokenBucket(20, 60)
+        self.max_workers = 8  # Parallel topic detail fetches
+        # Consecutive 404s from the single post endpoint per host, reset each fetch run;
+        # a host reaching by_number_max_misses is treated as not serving it
+        self._by_number_misses = {}
+        self._by_number_lock = threading.Lock()
+        self.by_number_max_misses = 3
+        # Finished weekly summaries by week start: (html, created_at), LRU ordered
+        self._weekly_cache = OrderedDict()
+        self._weekly_cache_size = 16
+        self._weekly_cache_ttl = 3600
+        self._weekly_cache_lock = threading.Lock()
+        try:
+            self.summary_cache = SemanticSummaryCache()
+        except Exception as e:
+            logger.warning(f"Summary cache disabled: {str(e)}")
+            self.summary_cache = None
+
+        # ETag / Last-Modified validators for Discourse JSON endpoints
+        self.http_cache = ConditionalRequestCache('forum_http_cache')
+
+        # Session shared across instances so keep-alive connections are reused.
+        # requests advertises every content encoding urllib3 can decode, so
+        # installing brotli adds br alongside gzip/deflate for Discourse JSON.
+        self.session = shared_session(('forum', self.max_workers), self._configure_session)
 
         # Initialize OpenAI client with graceful fallback
         try:
@@ -43,7 +215,7 @@ class ForumService:
                 logger.warning("OPENAI_API_KEY not set - summarization features will be disabled")
                 self.openai = None
             else:
-                self.openai = OpenAI(api_key=api_key)
+                self.openai = shared_openai_client(api_key)
                 logger.info("OpenAI client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {str(e)}")
@@ -51,12 +223,21 @@ class ForumService:
 
         logger.info("ForumService initialized successfully")
 
+    def _configure_session(self, session: requests.Session) -> None:
+        """Set headers and a connection pool on a new shared session."""
+        # One pool per forum host, sized so every fetch worker keeps its
+        # connection alive; retries are handled by _retry_with_backoff
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers * 2, max_retries=0)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; EthDevWatch/1.0; +https://ethdevwatch.replit.app)'
+        })
+
     def _format_forum_content(self, content: str, source: str, title: str, date: datetime, url: str) -> str:
         """Format forum content with consistent styling."""
         try:
             # Clean content
-            content_soup = BeautifulSoup(content, 'lxml')
-            clean_content = content_soup.get_text(strip=True)
+            clean_content = _extract_text(content, 500)
             brief_content = clean_content[:500] + ('...' if len(clean_content) > 500 else '')
 
             source_class = 'ethresearch-item' if 'ethresear.ch' in source else 'magicians-item'
@@ -77,7 +258,7 @@ class ForumService:
             </div>
             """
 
-            logger.debug(f"Successfully formatted forum content for {title}")
+            logger.debug("Successfully formatted forum content for %s", title)
             return formatted_content
 
         except Exception as e:
@@ -95,157 +276,309 @@ class ForumService:
 
     def fetch_ethresear_discussions(self, week_date: datetime) -> List[Dict]:
         """Fetch forum discussions from ethresear.ch for a specific week."""
+        index_urls = [f"{self.ethresear_base_url}/{category}" for category in self.ethresear_categories]
+        return self._fetch_discourse(index_urls, self.ethresear_base_url, 'ethresear.ch', week_date)
+
+    def _fetch_discourse(self, index_urls: List[str], base_url: str, source: str, week_date: datetime) -> List[Dict]:
+        """Fetch a week's discussions from a Discourse forum.
+
+        Args:
+            index_urls: Topic list endpoints to scan, e.g. category JSON URLs
+            base_url: Forum root used to build topic URLs
+            source: Forum name recorded on each discussion
+            week_date: Any date within the target week
+
+        Returns:
+            List of discussion dictionaries created during the week
+        """
         try:
             start_date, end_date = self._get_week_boundaries(week_date)
-            logger.info(f"Starting ethresear.ch discussions fetch for week of {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+            with self._by_number_lock:
+                self._by_number_misses.pop(base_url, None)
+            logger.info(f"Starting {source} discussions fetch for week of {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
             fetch_start_time = time.time()
 
-            all_discussions = []
-            processed_topics = set()  # Track processed topics to avoid duplicates
+            in_window = []
+            processed_topics = set()  # Track processed topics to avoid duplicates across lists
 
-            # Fetch from multiple categories
-            for category in self.ethresear_categories:
-                category_url = f"{self.ethresear_base_url}/{category}"
-                logger.info(f"Fetching discussions from category: {category}")
+            # Fetch every topic list up front; filtering and dedup stay single-threaded
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                topic_lists = list(executor.map(
+                    lambda index_url: self._get_topic_list(index_url, source),
+                    index_urls
+                ))
 
+            for index_url, topics in zip(index_urls, topic_lists):
                 try:
-                    # Add delay between category fetches
-                    if len(all_discussions) > 0:
-                        time.sleep(self.min_time_between_calls)
+                    total_topics = len(topics)
+                    logger.info(f"Found {total_topics} topics in {index_url}")
 
-                    response = self._retry_with_backoff(
-                        self.session.get,
-                        category_url,
-                        timeout=60
-                    )
+                    log_every = max(1, total_topics // 10)
+                    for index, topic in enumerate(topics, 1):
+                        try:
+                            if index % log_every == 0:
+                                logger.info("Processing topic %d/%d (%.1f%%)", index, total_topics, index / total_topics * 100)
 
-                    if response.status_code == 404:
-                        logger.warning(f"Category not found: {category}, skipping...")
-                        continue
+                            # Topics repeat across lists; skip them on the integer id first
+                            topic_id = topic.get('id')
+                            if topic_id in processed_topics:
+                                continue
 
-                    response.raise_for_status()
-                    data = response.json()
+                            # Validate required topic fields
+                            missing_fields = [field for field in _REQUIRED_TOPIC_FIELDS if not topic.get(field)]
 
-                    if not data or 'topic_list' not in data:
-                        logger.warning(f"Invalid response format from ethresear.ch for category: {category}")
-                        continue
+                            if missing_fields:
+                                logger.debug("Skipping topic due to missing fields: %s", ', '.join(missing_fields))
+                                continue
 
-                    topics = data['topic_list'].get('topics', [])
-                    logger.info(f"Found {len(topics)} topics in category {category}")
+                            # Lists are ordered by last activity with pinned topics first, so once
+                            # an unpinned topic was last bumped before the week, no later topic
+                            # can have been created inside it
+                            if not topic.get('pinned') and topic.get('bumped_at'):
+                                bumped_at = self._parse_discourse_date(topic['bumped_at'])
+                                if bumped_at and bumped_at < start_date:
+                                    logger.debug("Reached topics last active before %s, stopping scan", start_date)
+                                    break
 
-                    for topic in topics:
-                        try:
-                            topic_id = topic.get('id')
-                            if topic_id in processed_topics:  # Skip if already processed
-                                continue
                             processed_topics.add(topic_id)
 
-                            created_at = topic.get('created_at')
-                            if not created_at:
-                                continue
-
-                            try:
-                                # Try different date formats
-                                for date_format in ['%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%SZ']:
-                                    try:
-                                        post_date = datetime.strptime(created_at, date_format).replace(tzinfo=pytz.UTC)
-                                        break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    continue
-                            except Exception as e:
-                                logger.debug(f"Date parsing error for {created_at}: {str(e)}")
+                            post_date = self._parse_discourse_date(topic['created_at'])
+                            if post_date is None:
                                 continue
 
                             if start_date <= post_date <= end_date:
-                                slug = topic.get('slug', str(topic_id))
-                                topic_url = f"{self.ethresear_base_url}/t/{slug}/{topic_id}.json"
-
-                                # Add delay between topic fetches
-                                time.sleep(self.min_time_between_calls)
-
-                                topic_response = self._retry_with_backoff(
-                                    self.session.get,
-                                    topic_url,
-                                    timeout=30
-                                )
-                                topic_response.raise_for_status()
-                                topic_data = topic_response.json()
-
-                                if 'post_stream' in topic_data and 'posts' in topic_data['post_stream']:
-                                    first_post = topic_data['post_stream']['posts'][0]
-                                    content = first_post.get('cooked', '')
-
-                                    formatted_content = self._format_forum_content(
-                                        content=content,
-                                        source='ethresear.ch',
-                                        title=topic.get('title', ''),
-                                        date=post_date,
-                                        url=f"{self.ethresear_base_url}/t/{slug}/{topic_id}"
-                                    )
-                                    if formatted_content:
-                                        all_discussions.append({
-                                            'title': topic.get('title', ''),
-                                            'content': formatted_content,
-                                            'url': f"{self.ethresear_base_url}/t/{slug}/{topic_id}",
-                                            'date': post_date,
-                                            'source': 'ethresear.ch'
-                                        })
-                                        logger.info(f"Successfully added ethresear.ch discussion: {topic.get('title', '')}")
+                                in_window.append((topic, post_date))
 
                         except Exception as e:
-                            logger.error(f"Error processing ethresear.ch topic: {str(e)}", exc_info=True)
+                            logger.error(f"Error processing {source} topic: {str(e)}", exc_info=True)
                             continue
 
-                except requests.RequestException as e:
-                    logger.error(f"Failed to fetch ethresear.ch data for category {category}: {str(e)}")
+                except Exception as e:
+                    logger.error(f"Error processing {source} topic list {index_url}: {str(e)}", exc_info=True)
                     continue
 
+            discussions = self._fetch_topics(in_window, base_url, source)
+
             total_fetch_time = time.time() - fetch_start_time
-            logger.info(f"Successfully fetched {len(all_discussions)} relevant discussions from ethresear.ch in {total_fetch_time:.2f} seconds")
-            return all_discussions
+            logger.info(f"Successfully fetched {len(discussions)} relevant discussions from {source} in {total_fetch_time:.2f} seconds")
+            return discussions
 
         except Exception as e:
-            logger.error(f"Error fetching ethresear.ch discussions: {str(e)}", exc_info=True)
+            logger.error(f"Error fetching {source} discussions: {str(e)}", exc_info=True)
             return []
 
+    @staticmethod
+    def _parse_discourse_date(value: str) -> Optional[datetime]:
+        """Parse a Discourse timestamp into an aware UTC datetime."""
+        try:
+            # Python 3.11+ accepts the trailing Z and optional fractional seconds
+            return datetime.fromisoformat(value).astimezone(pytz.UTC)
+        except ValueError:
+            logger.error("Could not parse date %s", value)
+            return None
+
+    def _get_topic_list(self, index_url: str, source: str) -> List[Dict]:
+        """Fetch one Discourse topic list, returning an empty list on failure."""
+        logger.info(f"Fetching discussions from {index_url}")
+        try:
+            data = self._get_json(index_url, timeout=60)
+
+            if data is None:
+                logger.warning(f"Topic list not found: {index_url}, skipping...")
+                return []
+
+            if 'topic_list' not in data:
+                logger.warning(f"Invalid response format from {source} for {index_url}")
+                return []
+
+            return data['topic_list'].get('topics', [])
+
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {source} data from {index_url}: {str(e)}")
+            return []
+
+    def _fetch_one_topic(self, topic: Dict, post_date: datetime, base_url: str, source: str) -> Optional[Dict]:
+        """Fetch a topic's first post and build its discussion entry."""
+        try:
+            topic_id = topic.get('id')
+            slug = topic.get('slug', str(topic_id))
+            url = f"{base_url}/t/{slug}/{topic_id}"
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                topic_fetch_start = time.time()
+
+            first_post = self._get_opening_post(base_url, topic_id, url)
+            if not first_post:
+                return None
+
+            formatted_content = self._format_forum_content(
+                content=first_post.get('cooked', ''),
+                source=source,
+                title=topic.get('title', ''),
+                date=post_date,
+                url=url
+            )
+            if not formatted_content:
+                return None
+
+            if debug:
+                logger.debug("Added %s discussion: %s (processed in %.2f seconds)",
+                             source, topic.get('title', ''), time.time() - topic_fetch_start)
+            return {
+                'title': topic.get('title', ''),
+                'content': formatted_content,
+                # Opening post text for the summary prompt; content only holds a preview card
+                'body': _extract_text(first_post.get('cooked', ''), self.max_body_chars),
+                'url': url,
+                'date': post_date,
+                'source': source
+            }
+
+        except Exception as e:
+            logger.error("Error processing %s topic: %s", source, e, exc_info=True)
+            return None
+
+    def _fetch_topics(self, topics: List[Tuple[Dict, datetime]], base_url: str, source: str) -> List[Dict]:
+        """Fetch topic details concurrently, preserving the input order."""
+        if not topics:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                lambda item: self._fetch_one_topic(item[0], item[1], base_url, source),
+                topics
+            ))
+        return [result for result in results if result]
+
+    def _get_body(self, url: str, timeout: int = 30) -> Optional[bytes]:
+        """Fetch a Discourse JSON endpoint body using conditional requests.
+
+        Returns None when the endpoint does not exist. On 304 Not Modified the
+        body cached from the previous 200 response is reused, as it is when
+        the request still fails after all retries.
+        """
+        cached = self.http_cache.get(url)
+        try:
+            response = self._retry_with_backoff(
+                self._rate_limited_get,
+                url,
+                headers=self.http_cache.conditional_headers(cached),
+                timeout=timeout
+            )
+        except requests.RequestException as e:
+            if not cached:
+                raise
+            logger.warning(f"Request for {url} failed, serving cached response: {str(e)}")
+            return cached[2]
+
+        if response.status_code == 404:
+            return None
+
+        if response.status_code == 304 and cached:
+            logger.debug("Not modified, using cached response for %s", url)
+            return cached[2]
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.http_cache.set(url, (etag, last_modified, response.content))
+        return response.content
+
+    def _get_json(self, url: str, timeout: int = 30) -> Optional[Dict]:
+        """Fetch and decode a Discourse JSON endpoint, or None if it does not exist."""
+        body = self._get_body(url, timeout=timeout)
+        if body is None:
+            return None
+        return orjson.loads(body) if orjson else json.loads(body)
+
+    def _get_first_post(self, topic_url: str, timeout: int = 30) -> Optional[Dict]:
+        """Fetch a topic and decode only its first post.
+
+        Long threads carry hundreds of posts we never read, so the body is
+        parsed incrementally and parsing stops after the first post.
+        """
+        body = self._get_body(topic_url, timeout=timeout)
+        if body is None:
+            return None
+
+        if ijson:
+            posts = ijson.items(io.BytesIO(body), 'post_stream.posts.item', use_float=True)
+            return next(posts, None)
+
+        posts = json.loads(body).get('post_stream', {}).get('posts') or [None]
+        return posts[0]
+
+    def _get_opening_post(self, base_url: str, topic_id: int, topic_url: str) -> Optional[Dict]:
+        """Fetch only a topic's first post.
+
+        Discourse serves a single post at /posts/by_number/{topic_id}/1, which
+        avoids downloading the topic's whole post stream. When it fails, this
+        topic falls back to the topic JSON; only repeated 404s in a row stop
+        the endpoint being tried on the host for the rest of the fetch run.
+        """
+        with self._by_number_lock:
+            supported = self._by_number_misses.get(base_url, 0) < self.by_number_max_misses
+
+        if supported:
+            try:
+                post = self._get_json(f"{base_url}/posts/by_number/{topic_id}/1.json", timeout=30)
+                with self._by_number_lock:
+                    if post is not None:
+                        self._by_number_misses[base_url] = 0
+                        return post
+                    misses = self._by_number_misses.get(base_url, 0) + 1
+                    self._by_number_misses[base_url] = misses
+                if misses == self.by_number_max_misses:
+                    logger.info(f"Single post endpoint unavailable on {base_url}, using topic JSON")
+            except (requests.RequestException, ValueError) as e:
+                logger.debug("Single post endpoint failed for %s/%s: %s", base_url, topic_id, e)
+
+        return self._get_first_post(f"{topic_url}.json", timeout=30)
+
+    def _rate_limited_get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Issue a GET once the target host's token bucket allows it."""
+        limiter = self._limiters.get(urlparse(url).hostname)
+        if limiter:
+            limiter.acquire()
+        return self.session.get(url, **kwargs)
+
     def _wait_for_rate_limit(self):
-        """Implement rate limiting for API calls."""
-        now = time.time()
-        time_since_last_call = now - self.last_api_call
-        if time_since_last_call < self.min_time_between_calls:
-            sleep_time = self.min_time_between_calls - time_since_last_call
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        self.last_api_call = time.time()
+        """Implement rate limiting for OpenAI API calls."""
+        self._openai_limiter.acquire()
 
     def _retry_with_backoff(self, func: Any, *args: Any, **kwargs: Any) -> Any:
-        """Execute a function with exponential backoff retry logic."""
+        """Execute a function with exponential backoff retry logic.
+
+        Delays use decorrelated jitter so concurrent callers don't retry in
+        lockstep. Only rate limiting (429), server errors (5xx) and network
+        failures are retried; other 4xx responses fail immediately.
+        """
         last_error = None
+        delay = self.base_delay
         for attempt in range(self.max_retries):
             try:
-                self._wait_for_rate_limit()
                 response = func(*args, **kwargs)
 
                 if isinstance(response, requests.Response):
                     if response.status_code == 404:
                         return response  # Return 404 response without retrying
                     response.raise_for_status()
-                    logger.debug(f"Request successful - Status: {response.status_code}")
+                    logger.debug("Request successful - Status: %s", response.status_code)
                 return response
 
             except Exception as e:
                 last_error = e
-                delay = min(self.max_delay, self.base_delay * (2 ** attempt))
 
-                if isinstance(e, requests.RequestException) and hasattr(e, 'response'):
-                    logger.error(f"Request failed - Status: {e.response.status_code}")
-                    if e.response.status_code == 404:
+                status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status_code is not None:
+                    logger.error(f"Request failed - Status: {status_code}")
+                    if status_code == 404:
                         return e.response  # Return 404 response without retrying
+                    if status_code != 429 and status_code < 500:
+                        raise  # Client errors won't succeed on retry
 
                 if attempt < self.max_retries - 1:
-                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay} seconds...")
+                    delay = random.uniform(self.base_delay, min(self.max_delay, delay * 3))
+                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {delay:.2f} seconds...")
                     time.sleep(delay)
                 else:
                     logger.error(f"All {self.max_retries} attempts failed")
@@ -253,52 +586,26 @@ class ForumService:
         raise last_error
 
     def summarize_forum_discussions(self, discussions: List[Dict], source: str) -> Optional[str]:
-        """Generate a summary of forum discussions for a specific source using OpenAI."""
+        """Generate a summary of forum discussions for a specific source using OpenAI.
+
+        Returns None when no summary could be generated; callers show the raw
+        discussions instead, see _format_raw_discussions.
+        """
         if not discussions:
             logger.warning(f"No discussions provided for summarization from {source}")
             return None
 
         if not self.openai:
-            logger.warning("OpenAI client not initialized - returning raw discussion content")
-            return self._format_raw_discussions(discussions)
+            logger.warning("OpenAI client not initialized - no summary generated")
+            return None
 
         try:
             logger.info(f"Starting {source} forum discussions summarization")
-            formatted_discussions = []
-            for disc in discussions:
-                content_soup = BeautifulSoup(disc['content'], 'lxml')
-                clean_content = content_soup.get_text(strip=True)
-                formatted_discussions.append(
-                    f"Title: {disc['title']}\n"
-                    f"Date: {disc['date'].strftime('%Y-%m-%d')}\n"
-                    f"URL: {disc['url']}\n"
-                    f"Content Summary: {clean_content[:1000]}..."
-                )
+            cached_summary, cache_key = self._cached_summary(discussions, source)
+            if cached_summary:
+                return cached_summary
 
-            combined_text = "\n\n---\n\n".join(formatted_discussions)
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"""You are an expert in Ethereum protocol discussions. 
-                    Summarize the key points from {source} forum discussions in a clear, 
-                    accessible way. Focus on:
-                    1. Main topics discussed
-                    2. Important decisions or consensus reached
-                    3. Notable technical proposals
-                    Keep the summary concise and use plain language.
-
-                    Format your response as a clean HTML section with:
-                    - A section header for {source}
-                    - Key points in bullet points
-                    - No full HTML document tags (html, head, body)
-                    - Use div with appropriate classes for styling"""
-                },
-                {
-                    "role": "user",
-                    "content": f"Summarize these {source} discussions from the past week:\n\n{combined_text}"
-                }
-            ]
+            messages = self._summary_messages(self._condense_discussions(discussions), source)
 
             logger.info(f"Sending request to OpenAI for {source} forum discussion summary")
 
@@ -310,311 +617,435 @@ class ForumService:
                     temperature=0.7,
                     max_tokens=1000
                 )
+                return self._finish_summary(response.choices[0].message.content, source, cache_key)
+
+            except Exception as e:
+                logger.error(f"OpenAI API error: {str(e)}")
+                return None
+
+        except Exception as e:
+            logger.error(f"Error generating {source} forum discussion summary: {str(e)}", exc_info=True)
+            return None
+
+    async def _asummarize_forum_discussions(self, discussions: List[Dict], source: str,
+                                            client: AsyncOpenAI, sem: asyncio.Semaphore) -> Optional[str]:
+        """Async counterpart of summarize_forum_discussions, sharing its caches."""
+        if not discussions or not self.openai:
+            return None
+
+        try:
+            # The cache lookups block (SQLite and an embedding call), so run them off the loop
+            cached_summary, cache_key = await asyncio.to_thread(self._cached_summary, discussions, source)
+            if cached_summary:
+                return cached_summary
+
+            messages = self._summary_messages(await self._acondense_discussions(discussions, client), source)
+            async with sem:
+                await asyncio.to_thread(self._openai_limiter.acquire)
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=1000
+                )
+            return await asyncio.to_thread(self._finish_summary, response.choices[0].message.content, source, cache_key)
 
-                summary = response.choices[0].message.content.strip()
-                logger.info(f"Successfully generated {source} forum discussion summary")
+        except Exception as e:
+            logger.error(f"Error generating {source} forum discussion summary: {str(e)}")
+            return None
+
+    def _cached_summary(self, discussions: List[Dict], source: str) -> Tuple[Optional[str], Optional[tuple]]:
+        """Look up a summary of identical, then near-identical, discussions.
+
+        Returns the cached summary on a hit, and the (namespace, embedding,
+        digest) key a fresh summary should be stored under otherwise.
+        """
+        if not self.summary_cache:
+            return None, None
+
+        digest = self._discussions_digest(discussions)
+        cached_summary = self._lookup_exact_summary(digest)
+        if not cached_summary:
+            namespace = self._summary_cache_namespace(discussions, source)
+            embedding, cached_summary = self._lookup_similar_summary(
+                namespace, self._build_combined_text(discussions, _SOURCE_SYSTEM_PROMPT.format(source=source))
+            )
+        if cached_summary:
+            logger.info(f"Using cached {source} forum discussion summary")
+            return cached_summary, None
+        return None, (namespace, embedding, digest)
+
+    def _summary_messages(self, discussions: List[Dict], source: str) -> List[Dict]:
+        """Build the chat messages asking for a summary of one source's discussions."""
+        system_prompt = _SOURCE_SYSTEM_PROMPT.format(source=source)
+        combined_text = self._build_combined_text(discussions, system_prompt)
+        return [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": f"Summarize these {source} discussions from the past week:\n\n{combined_text}"
+            }
+        ]
 
-                # Ensure proper HTML structure without document tags
-                if not summary.startswith('<div'):
-                    summary = f"""
+    def _finish_summary(self, summary: str, source: str, cache_key: Optional[tuple]) -> str:
+        """Wrap a generated summary in its section and store it in the summary cache."""
+        summary = summary.strip()
+        logger.info(f"Successfully generated {source} forum discussion summary")
+
+        # Ensure proper HTML structure without document tags
+        if not summary.startswith('<div'):
+            summary = f"""
                     <div class="forum-summary {source.lower().replace('.', '-')}">
                         <h3 class="forum-source-title mb-3">{source} Summary</h3>
                         {summary}
                     </div>
                     """
 
-                return summary
-
-            except Exception as e:
-                logger.error(f"OpenAI API error: {str(e)}")
-                return self._format_raw_discussions(discussions)
-
-        except Exception as e:
-            logger.error(f"Error generating {source} forum discussion summary: {str(e)}", exc_info=True)
-            return self._format_raw_discussions(discussions)
+        if cache_key:
+            self._store_cached_summary(*cache_key, summary)
+        return summary
 
     def get_weekly_forum_summary(self, date: datetime) -> Optional[str]:
         """Get a summary of forum discussions for a specific week."""
-        try:
-            logger.info(f"Starting forum summary generation for week of {date.strftime('%Y-%m-%d')}")
-
-            # Fetch discussions from both sources
-            em_discussions = self.fetch_forum_discussions(date)
-            ethresear_discussions = self.fetch_ethresear_discussions(date)
+        return self.summarize_week(date)[0]
 
-            if not em_discussions and not ethresear_discussions:
-                logger.warning("No forum discussions found for the specified week")
-                return '<div class="alert alert-info">No forum discussions found for this week.</div>'
+    def summarize_week(self, date: datetime) -> Tuple[str, bool]:
+        """Build a week's forum discussion page.
 
-            logger.info(f"Found {len(em_discussions)} Ethereum Magicians discussions and {len(ethresear_discussions)} Ethereum Research discussions")
+        Returns:
+            The page HTML, and whether it is complete: every source with
+            discussions was summarized and nothing failed. Incomplete pages
+            show raw discussions or an error and should not be cached.
+        """
+        week_key = self._get_week_boundaries(date)[0].date()
+        cached = self._get_cached_week(week_key)
+        if cached:
+            return cached, True
 
-            # Generate summaries for each source
-            em_summary = None
-            ethresear_summary = None
+        try:
+            em_discussions, ethresear_discussions = self._fetch_week_discussions(date)
+            if not em_discussions and not ethresear_discussions:
+                return _NO_DISCUSSIONS_PAGE, True
 
+            em_summary = ethresear_summary = None
             if em_discussions:
                 logger.info("Generating Ethereum Magicians summary...")
                 em_summary = self.summarize_forum_discussions(em_discussions, "Ethereum Magicians")
-                if not em_summary:
-                    logger.error("Failed to generate Ethereum Magicians summary")
-                time.sleep(self.min_time_between_calls)
-
             if ethresear_discussions:
                 logger.info("Generating Ethereum Research summary...")
                 ethresear_summary = self.summarize_forum_discussions(ethresear_discussions, "Ethereum Research")
-                if not ethresear_summary:
-                    logger.error("Failed to generate Ethereum Research summary")
 
-            # Combine summaries and discussions
-            content_parts = []
+            return self._finish_week(week_key, em_discussions, ethresear_discussions, em_summary, ethresear_summary)
 
-            # Add summaries section
-            content_parts.append('<div class="forum-summaries mb-4">')
-            content_parts.append('<h2 class="forum-summaries-title mb-3">Forum Discussion Summaries</h2>')
+        except Exception as e:
+            logger.error(f"Error generating weekly forum summary: {str(e)}", exc_info=True)
+            return _ERROR_PAGE, False
 
-            if em_summary or ethresear_summary:
-                if em_summary:
-                    content_parts.append(em_summary)
-                if ethresear_summary:
-                    content_parts.append(ethresear_summary)
-            else:
-                content_parts.append('<div class="alert alert-warning">Unable to generate forum summaries. Please check the logs for details.</div>')
+    def summarize_weeks(self, dates: List[datetime]) -> List[Tuple[str, bool]]:
+        """Build several weeks' forum pages concurrently, for back-fills.
 
-            content_parts.append('</div>')
+        Discussions are fetched on worker threads and summarized through
+        AsyncOpenAI, at most max_concurrent_summaries calls at a time, so a
+        back-fill takes about as long as its slowest weeks rather than the sum.
 
-            # Add detailed discussions section
-            content_parts.append('<div class="forum-discussions mt-4">')
-            content_parts.append('<h2 class="forum-discussions-title mb-3">Recent Forum Discussions</h2>')
+        Returns:
+            (page, complete) per date, in order, as summarize_week returns them
+        """
+        if not self.openai:
+            return [self.summarize_week(date) for date in dates]
 
-            if em_discussions:
-                content_parts.append('<div class="ethereum-magicians-section mb-4">')
-                content_parts.append('<h3 class="section-title">Ethereum Magicians Discussions</h3>')
-                content_parts.extend(disc['content'] for disc in em_discussions)
-                content_parts.append('</div>')
-            else:
-                content_parts.append('<div class="alert alert-info">No Ethereum Magicians discussions found for this period.</div>')
+        async def _gather() -> List[Tuple[str, bool]]:
+            # The client and semaphore belong to this event loop, so both are made per run
+            sem = asyncio.Semaphore(self.max_concurrent_summaries)
+            async with AsyncOpenAI(api_key=self.openai.api_key) as client:
+                return await asyncio.gather(*(self._asummarize_week(date, client, sem) for date in dates))
 
-            if ethresear_discussions:
-                content_parts.append('<div class="ethereum-research-section mb-4">')
-                content_parts.append('<h3 class="section-title">Ethereum Research Discussions</h3>')
-                content_parts.extend(disc['content'] for disc in ethresear_discussions)
-                content_parts.append('</div>')
-            else:
-                content_parts.append('<div class="alert alert-info">No Ethereum Research discussions found for this period.</div>')
+        logger.info(f"Summarizing forum discussions for {len(dates)} weeks concurrently")
+        return list(asyncio.run(_gather()))
 
-            content_parts.append('</div>')
+    async def _asummarize_week(self, date: datetime, client: AsyncOpenAI,
+                               sem: asyncio.Semaphore) -> Tuple[str, bool]:
+        """Async counterpart of summarize_week."""
+        week_key = self._get_week_boundaries(date)[0].date()
+        cached = self._get_cached_week(week_key)
+        if cached:
+            return cached, True
 
-            # Combine all parts
-            summary = '<div class="forum-discussions-container">' + '\n'.join(content_parts) + '</div>'
-            logger.info("Successfully generated complete forum summary")
-            return summary
+        try:
+            em_discussions, ethresear_discussions = await asyncio.to_thread(self._fetch_week_discussions, date)
+            if not em_discussions and not ethresear_discussions:
+                return _NO_DISCUSSIONS_PAGE, True
+
+            em_summary, ethresear_summary = await asyncio.gather(
+                self._asummarize_forum_discussions(em_discussions, "Ethereum Magicians", client, sem),
+                self._asummarize_forum_discussions(ethresear_discussions, "Ethereum Research", client, sem)
+            )
+            return self._finish_week(week_key, em_discussions, ethresear_discussions, em_summary, ethresear_summary)
 
         except Exception as e:
             logger.error(f"Error generating weekly forum summary: {str(e)}", exc_info=True)
-            return '<div class="alert alert-danger">An error occurred while generating the forum summary. Please check the logs for details.</div>'
+            return _ERROR_PAGE, False
+
+    def _get_cached_week(self, week_key) -> Optional[str]:
+        """Return the finished page for a week if it is still fresh."""
+        with self._weekly_cache_lock:
+            cached = self._weekly_cache.get(week_key)
+            if cached and time.time() - cached[1] < self._weekly_cache_ttl:
+                self._weekly_cache.move_to_end(week_key)
+                logger.info(f"Using cached forum summary for week of {week_key}")
+                return cached[0]
+        return None
+
+    def _fetch_week_discussions(self, date: datetime) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch a week's Ethereum Magicians and Ethereum Research discussions."""
+        logger.info(f"Starting forum summary generation for week of {date.strftime('%Y-%m-%d')}")
+
+        # Fetch discussions from both sources concurrently; they hit different hosts
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            em_future = executor.submit(self.fetch_forum_discussions, date)
+            ethresear_future = executor.submit(self.fetch_ethresear_discussions, date)
+            em_discussions = em_future.result()
+            ethresear_discussions = ethresear_future.result()
+
+        if not em_discussions and not ethresear_discussions:
+            logger.warning("No forum discussions found for the specified week")
+        else:
+            logger.info(f"Found {len(em_discussions)} Ethereum Magicians discussions and {len(ethresear_discussions)} Ethereum Research discussions")
+        return em_discussions, ethresear_discussions
+
+    def _finish_week(self, week_key, em_discussions: List[Dict], ethresear_discussions: List[Dict],
+                     em_summary: Optional[str], ethresear_summary: Optional[str]) -> Tuple[str, bool]:
+        """Assemble a week's page from its discussions and summaries, caching it if complete."""
+        # Only a page where every source was summarized is cached; raw
+        # fallbacks should be retried on the next request
+        summarized = True
+
+        if em_discussions and not em_summary:
+            logger.error("Failed to generate Ethereum Magicians summary")
+            em_summary = self._format_raw_discussions(em_discussions)
+            summarized = False
+
+        if ethresear_discussions and not ethresear_summary:
+            logger.error("Failed to generate Ethereum Research summary")
+            ethresear_summary = self._format_raw_discussions(ethresear_discussions)
+            summarized = False
+
+        # Combine summaries and discussions
+        content_parts = []
+
+        # Add summaries section
+        content_parts.append('<div class="forum-summaries mb-4">')
+        content_parts.append('<h2 class="forum-summaries-title mb-3">Forum Discussion Summaries</h2>')
+        if em_summary:
+            content_parts.append(em_summary)
+        if ethresear_summary:
+            content_parts.append(ethresear_summary)
+        content_parts.append('</div>')
+
+        # Add detailed discussions section
+        content_parts.append('<div class="forum-discussions mt-4">')
+        content_parts.append('<h2 class="forum-discussions-title mb-3">Recent Forum Discussions</h2>')
+
+        if em_discussions:
+            content_parts.append('<div class="ethereum-magicians-section mb-4">')
+            content_parts.append('<h3 class="section-title">Ethereum Magicians Discussions</h3>')
+            content_parts.extend(disc['content'] for disc in em_discussions)
+            content_parts.append('</div>')
+        else:
+            content_parts.append('<div class="alert alert-info">No Ethereum Magicians discussions found for this period.</div>')
+
+        if ethresear_discussions:
+            content_parts.append('<div class="ethereum-research-section mb-4">')
+            content_parts.append('<h3 class="section-title">Ethereum Research Discussions</h3>')
+            content_parts.extend(disc['content'] for disc in ethresear_discussions)
+            content_parts.append('</div>')
+        else:
+            content_parts.append('<div class="alert alert-info">No Ethereum Research discussions found for this period.</div>')
+
+        content_parts.append('</div>')
+
+        # Combine all parts
+        summary = '<div class="forum-discussions-container">' + '\n'.join(content_parts) + '</div>'
+        logger.info("Successfully generated complete forum summary")
+
+        if summarized:
+            with self._weekly_cache_lock:
+                self._weekly_cache[week_key] = (summary, time.time())
+                self._weekly_cache.move_to_end(week_key)
+                while len(self._weekly_cache) > self._weekly_cache_size:
+                    self._weekly_cache.popitem(last=False)
+        return summary, summarized
 
     def _format_raw_discussions(self, discussions: List[Dict]) -> str:
         """Format discussions without OpenAI summarization."""
-        formatted_content = []
+        buf = io.StringIO()
+        buf.write(_RAW_HEADER)
         for disc in discussions:
-            content_soup = BeautifulSoup(disc['content'], 'lxml')
-            clean_content = content_soup.get_text(strip=True)[:500]
-            formatted_content.append(f"""
-                <div class="forum-discussion-item">
-                    <h4>{disc['title']}</h4>
-                    <p>Source: {disc['source']}</p>
-                    <p>Date: {disc['date'].strftime('%Y-%m-%d')}</p>
-                    <div class="forum-content">{clean_content}...</div>
-                    <a href="{disc['url']}" target="_blank" class="forum-link">
-                        Read more →
-                    </a>
-                </div>
-            """)
-
-        return f"""
-        <div class="forum-discussion-summary">
-            <div class="alert alert-info">
-                Summaries are temporarily unavailable. Showing raw discussion content.
-            </div>
-            {''.join(formatted_content)}
-        </div>
-        """
+            buf.write(_RAW_TEMPLATE.format(
+                title=html.escape(disc['title']),
+                source=html.escape(disc['source']),
+                date=disc['date'].strftime('%Y-%m-%d'),
+                content=html.escape(_extract_text(disc['content'], 500)[:500]),
+                url=html.escape(disc['url'])
+            ))
+        buf.write(_RAW_FOOTER)
+        return buf.getvalue()
 
     def fetch_forum_discussions(self, week_date: datetime) -> List[Dict]:
         """Fetch forum discussions from Ethereum Magicians for a specific week."""
-        try:
-            start_date, end_date = self._get_week_boundaries(week_date)
-            logger.info(f"Starting forum discussions fetch for week of {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-            self._wait_for_rate_limit()  # Ensure we respect rate limits
-            fetch_start_time = time.time()
+        return self._fetch_discourse([self.forum_base_url], self.magicians_base_url, 'ethereum-magicians.org', week_date)
 
-            # Use the JSON API endpoint with retries
-            response = self._retry_with_backoff(
-                self.session.get,
-                self.forum_base_url,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
-            initial_fetch_time = time.time() - fetch_start_time
-            logger.info(f"Initial forum data fetch completed in {initial_fetch_time:.2f} seconds")
-
-            discussions = []
-            if 'topic_list' in data and 'topics' in data['topic_list']:
-                topics = data['topic_list']['topics']
-                total_topics = len(topics)
-                logger.info(f"Found {total_topics} topics to process")
-
-                for index, topic in enumerate(topics, 1):
-                    try:
-                        process_start_time = time.time()
-                        logger.info(f"Processing topic {index}/{total_topics} ({(index/total_topics)*100:.1f}%)")
-
-                        # Validate required topic fields
-                        required_fields = ['created_at', 'id', 'title']
-                        missing_fields = [field for field in required_fields if not topic.get(field)]
-
-                        if missing_fields:
-                            logger.warning(f"Skipping topic due to missing fields: {', '.join(missing_fields)}")
-                            continue
-
-                        created_at = topic['created_at']
+    async def _atldr(self, client: AsyncOpenAI, disc: Dict, sem: asyncio.Semaphore) -> Dict:
+        """Replace a discussion's body with a short TL;DR from the cheap model.
 
-                        try:
-                            # Try different date formats
-                            for date_format in ['%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%SZ']:
-                                try:
-                                    post_date = datetime.strptime(created_at, date_format).replace(tzinfo=pytz.UTC)
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                logger.error(f"Could not parse date {created_at} in any known format")
-                                continue
+        The original discussion is returned unchanged if the request fails.
+        """
+        try:
+            content, _ = _truncate_tokens(disc['body'], self.max_tokens_per_discussion * 2)
+            async with sem:
+                # Shares the OpenAI budget with the summary calls; the bucket blocks, so off the loop
+                await asyncio.to_thread(self._openai_limiter.acquire)
+                response = await client.chat.completions.create(
+                    model=self.tldr_model,
+                    messages=[
+                        {"role": "system", "content": _TLDR_SYSTEM_PROMPT},
+                        {"role": "user", "content": f"Title: {disc['title']}\n\n{content}"}
+                    ],
+                    temperature=0.3,
+                    max_tokens=120
+                )
+            return {**disc, 'body': response.choices[0].message.content.strip()}
+        except Exception as e:
+            logger.warning(f"TL;DR failed for {disc['url']}, using post text: {str(e)}")
+            return disc
 
-                        except Exception as e:
-                            logger.error(f"Unexpected error parsing date {created_at}: {str(e)}")
-                            continue
+    def _long_discussion_indexes(self, discussions: List[Dict]) -> List[int]:
+        """Positions of the discussions whose body is long enough to condense."""
+        return [i for i, disc in enumerate(discussions) if len(disc.get('body', '')) > self.tldr_min_chars]
 
-                        if start_date <= post_date <= end_date:
-                            topic_id = topic.get('id')
-                            slug = topic.get('slug', str(topic_id))
-                            topic_url = f"https://ethereum-magicians.org/t/{slug}/{topic_id}.json"
-
-                            logger.debug(f"Fetching details for topic: {topic.get('title', 'Unknown')}")
-                            topic_fetch_start = time.time()
-
-                            # Fetch full topic content with retries
-                            topic_response = self._retry_with_backoff(
-                                self.session.get,
-                                topic_url,
-                                timeout=30
-                            )
-                            topic_response.raise_for_status()
-                            topic_data = topic_response.json()
-
-                            topic_fetch_time = time.time() - topic_fetch_start
-                            logger.debug(f"Topic details fetched in {topic_fetch_time:.2f} seconds")
-
-                            if 'post_stream' in topic_data and 'posts' in topic_data['post_stream']:
-                                first_post = topic_data['post_stream']['posts'][0]
-                                content = first_post.get('cooked', '')
-
-                                formatted_content = self._format_forum_content(
-                                    content=content,
-                                    source='ethereum-magicians.org',
-                                    title=topic.get('title', ''),
-                                    date=post_date,
-                                    url=f"https://ethereum-magicians.org/t/{slug}/{topic_id}"
-                                )
-                                if formatted_content:
-                                    discussions.append({
-                                        'title': topic.get('title', ''),
-                                        'content': formatted_content,
-                                        'url': f"https://ethereum-magicians.org/t/{slug}/{topic_id}",
-                                        'date': post_date,
-                                        'source': 'ethereum-magicians.org'
-                                    })
-                                    process_time = time.time() - process_start_time
-                                    logger.info(f"Successfully added discussion: {topic.get('title', '')} (processed in {process_time:.2f} seconds)")
-
-                    except Exception as e:
-                        logger.error(f"Error processing topic: {str(e)}", exc_info=True)
-                        continue
+    async def _acondense_discussions(self, discussions: List[Dict], client: AsyncOpenAI) -> List[Dict]:
+        """Condense long discussions concurrently ahead of the final summary call.
 
-            total_fetch_time = time.time() - fetch_start_time
-            logger.info(f"Successfully fetched {len(discussions)} relevant discussions in {total_fetch_time:.2f} seconds")
+        Only bodies longer than tldr_min_chars are sent to the cheap model; the
+        rest would barely shrink. The order of discussions is kept.
+        """
+        long_indexes = self._long_discussion_indexes(discussions)
+        if not long_indexes:
             return discussions
 
-        except Exception as e:
-            logger.error(f"Error fetching forum discussions: {str(e)}", exc_info=True)
-            return []
+        # Created per call so the semaphore belongs to the running loop
+        sem = asyncio.Semaphore(self.max_concurrent_tldrs)
+        condensed = await asyncio.gather(*(self._atldr(client, discussions[i], sem) for i in long_indexes))
+        logger.info(f"Condensed {len(long_indexes)} of {len(discussions)} discussions")
 
-    def summarize_discussions(self, discussions: List[Dict]) -> Optional[str]:
-        """Generate a summary of forum discussions using OpenAI."""
-        if not discussions:
-            logger.warning("No discussions provided for summarization")
-            return None
+        result = list(discussions)
+        for i, disc in zip(long_indexes, condensed):
+            result[i] = disc
+        return result
 
-        if not self.openai:
-            logger.warning("OpenAI client not initialized - returning raw discussion content")
-            return self._format_raw_discussions(discussions)
+    def _condense_discussions(self, discussions: List[Dict]) -> List[Dict]:
+        """Synchronous wrapper around _acondense_discussions."""
+        if not self.openai or not self._long_discussion_indexes(discussions):
+            return discussions
+
+        async def _run() -> List[Dict]:
+            # A client per event loop; pooled connections can't outlive asyncio.run
+            async with AsyncOpenAI(api_key=self.openai.api_key) as client:
+                return await self._acondense_discussions(discussions, client)
 
         try:
-            logger.info("Starting forum discussions summarization")
-            formatted_discussions = []
-            for disc in discussions:
-                content_soup = BeautifulSoup(disc['content'], 'lxml')
-                clean_content = content_soup.get_text(strip=True)
-                formatted_discussions.append(
-                    f"Title: {disc['title']}\nSource: {disc['source']}\n"
-                    f"Date: {disc['date'].strftime('%Y-%m-%d')}\n"
-                    f"URL: {disc['url']}\nContent: {clean_content[:1000]}..."
-                )
+            return asyncio.run(_run())
+        except Exception as e:
+            logger.warning(f"Failed to condense discussions, using post text: {str(e)}")
+            return discussions
 
-            combined_text = "\n\n---\n\n".join(formatted_discussions)
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": """You are an expert in Ethereum protocol discussions. 
-                    Summarize the key points from Ethereum forum discussions in a clear, 
-                    accessible way. Focus on:
-                    1. Main topics discussed
-                    2. Important decisions or consensus reached
-                    3. Notable technical proposals
-                    Keep the summary concise and use plain language.
-                    Format the output in HTML, using appropriate tags for structure."""
-                },
-                {
-                    "role": "user",
-                    "content": f"Summarize these Ethereum forum discussions:\n\n{combined_text}"
-                }
-            ]
-
-            logger.info("Sending request to OpenAI for forum discussion summary")
+    def _build_combined_text(self, discussions: List[Dict], system_prompt: str) -> str:
+        """Flatten discussions into the text block sent to OpenAI.
 
-            try:
-                self._wait_for_rate_limit()
-                response = self.openai.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=0.7,
-                    max_tokens=1000
-                )
+        Discussions are grouped under a header per source. Each discussion's
+        body (or its TL;DR) is capped at max_tokens_per_discussion, and
+        discussions are added until the prompt token budget is used up.
+        """
+        _, system_tokens = _truncate_tokens(system_prompt, self.prompt_token_budget)
+        budget = self.prompt_token_budget - system_tokens - 500  # Room for the user instruction
 
-                summary = response.choices[0].message.content.strip()
-                logger.info("Successfully generated forum discussion summary")
+        grouped = defaultdict(list)
+        added = 0
+        running = 0
+        for disc in discussions:
+            clean_content, _ = _truncate_tokens(
+                disc.get('body') or _extract_text(disc['content'], self.max_tokens_per_discussion * 4),
+                self.max_tokens_per_discussion
+            )
+            formatted, tokens = _truncate_tokens(
+                f"Title: {disc['title']}\nDate: {disc['date']:%Y-%m-%d}\n"
+                f"URL: {disc['url']}\nContent: {clean_content}...",
+                budget
+            )
+            if running + tokens > budget:
+                logger.info(f"Prompt token budget reached after {added} of {len(discussions)} discussions")
+                break
+            grouped[disc['source']].append(formatted)
+            added += 1
+            running += tokens
+
+        parts = []
+        for source, entries in grouped.items():
+            parts.append(f"Source: {source}")
+            parts.extend(entries)
+        return "\n\n---\n\n".join(parts)
+
+    def _summary_cache_namespace(self, discussions: List[Dict], source: str) -> str:
+        """Namespace cached summaries by source and the week of the earliest discussion."""
+        week_start, _ = self._get_week_boundaries(min(disc['date'] for disc in discussions))
+        return f"{source}:{week_start:%Y-%m-%d}"
+
+    @staticmethod
+    def _discussions_digest(discussions: List[Dict]) -> str:
+        """Hash the sorted discussion URLs and texts for exact-match caching."""
+        digest = hashlib.sha256()
+        for url, content in sorted((disc['url'], disc['content'] + disc.get('body', '')) for disc in discussions):
+            digest.update(url.encode('utf-8'))
+            digest.update(hashlib.sha256(content.encode('utf-8')).digest())
+        return digest.hexdigest()
+
+    def _lookup_exact_summary(self, digest: str) -> Optional[str]:
+        """Look up a summary by exact input digest, logging rather than raising on failure."""
+        try:
+            return self.summary_cache.lookup_exact(digest)
+        except Exception as e:
+            logger.warning(f"Summary cache unavailable: {str(e)}")
+            return None
 
-                if not summary.startswith('<'):
-                    summary = f'<div class="forum-discussion-summary">{summary}</div>'
+    def _lookup_similar_summary(self, namespace: str, combined_text: str) -> Tuple[Optional[List[float]], Optional[str]]:
+        """Embed the discussions and look up a close enough cached summary.
 
-                return summary
+        Returns the embedding, so a fresh summary can be stored under it, and
+        the cached summary if there was a hit. Failures are logged, not raised.
+        """
+        try:
+            embedding = self.openai.embeddings.create(
+                model=self.embedding_model,
+                input=combined_text
+            ).data[0].embedding
+        except Exception as e:
+            logger.warning(f"Summary cache unavailable: {str(e)}")
+            return None, None
 
-            except Exception as e:
-                logger.error(f"OpenAI API error: {str(e)}")
-                return self._format_raw_discussions(discussions)
+        try:
+            return embedding, self.summary_cache.lookup(namespace, embedding)
+        except Exception as e:
+            logger.warning(f"Summary cache unavailable: {str(e)}")
+            return embedding, None
 
+    def _store_cached_summary(self, namespace: str, embedding: Optional[List[float]], digest: str, summary: str) -> None:
+        """Store a summary in the cache, logging rather than raising on failure."""
+        try:
+            self.summary_cache.store_exact(digest, summary)
+            if embedding is not None:
+                self.summary_cache.store(namespace, embedding, summary)
         except Exception as e:
-            logger.error(f"Error generating forum discussion summary: {str(e)}", exc_info=True)
-            return None
\ No newline at end of file
+            logger.warning(f"Failed to cache forum summary: {str(e)}")
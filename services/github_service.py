@@ -1,17 +1,74 @@
+import copy
+import heapq
+import json
 import os
 import logging
+import random
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode
 import pytz
+import requests
+from requests.adapters import HTTPAdapter
 from github import Github
 from github.GithubException import GithubException, RateLimitExceededException
+from services.clients import shared_session
+from services.http_cache import ConditionalRequestCache, path_lock
 
 logger = logging.getLogger(__name__)
 
+# Issues, pull requests and default-branch history for one repository; the REST
+# issues endpoint returns issues and pull requests together
+_GRAPHQL_REPO_FRAGMENT = """
+fragment RepoContent on Repository {
+  issues(first: 100, filterBy: {since: $since}, orderBy: {field: CREATED_AT, direction: DESC}) {
+    pageInfo { hasNextPage }
+    nodes { title url body createdAt labels(first: 20) { nodes { name } } }
+  }
+  pullRequests(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {
+    pageInfo { hasNextPage }
+    nodes { title url body createdAt labels(first: 20) { nodes { name } } }
+  }
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(first: 100, since: $gitSince, until: $gitUntil) {
+          pageInfo { hasNextPage }
+          nodes { message url authoredDate parents { totalCount } author { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp into an aware UTC datetime"""
+    parsed = datetime.fromisoformat(value)
+    # Most timestamps already end in Z; only commit dates may carry an offset
+    if value.endswith('Z'):
+        return parsed
+    return parsed.astimezone(timezone.utc)
+
+
 class GitHubService:
     """Service for fetching content from Ethereum-related GitHub repositories"""
 
+    # Recent per-repository results keyed by (repo, start, end): (content, fetched_at).
+    # Shared by all instances, since routes, the scheduler and scripts each build their own.
+    _content_cache = OrderedDict()
+    _content_cache_size = 64
+    _content_cache_ttl = 3600
+    _content_cache_lock = threading.Lock()
+    # Futures of fetches in progress, by the same key, so concurrent callers share one
+    _inflight = {}
+
     def __init__(self):
         self.github_token = os.environ.get('GITHUB_TOKEN')
         if not self.github_token:
@@ -21,6 +78,20 @@ class GitHubService:
             logger.info("Initializing GitHub client with authentication")
             self.github = Github(self.github_token)
 
+        self.api_url = "https://api.github.com"
+
+        # ETag validators and bodies of list pages, reused across weekly runs
+        self.http_cache = ConditionalRequestCache('github_http_cache')
+
+        # Last successful fetch per repository, so overlapping windows only fetch what's new.
+        # The file is shared by every instance, so is its lock. The last overlap before
+        # the watermark is fetched again, since commits can be pushed well after they
+        # were authored; entries older than watermark_ttl are ignored and pruned.
+        self._watermark_path = os.path.join(os.getcwd(), 'instance', 'github_watermarks.json')
+        self._watermark_lock = path_lock(self._watermark_path)
+        self.watermark_overlap = timedelta(days=1)
+        self.watermark_ttl = timedelta(days=7)
+
         # Core Ethereum repositories to monitor
         self.repositories = [
             "ethereum/pm",  # Core protocol meetings
@@ -32,73 +103,438 @@ class GitHubService:
 
         self.max_retries = 3
         self.base_delay = 2  # Base delay for exponential backoff
-        self.max_workers = 3  # Number of parallel workers for fetching
+        self.max_delay = 60
+        self._rate_limit_reset = None  # Epoch of the last X-RateLimit-Reset seen
+        self.search_lag = timedelta(days=1)  # Ranges older than this use the search API
+        self.max_workers = len(self.repositories)  # Fetch every repository at once
+
+        # Plain REST session for list endpoints, shared so pooled connections outlive this instance
+        self.session = shared_session(('github', self.github_token, self.max_workers), self._configure_session)
+
+    def _configure_session(self, session: requests.Session):
+        """Set GitHub headers and a connection pool on a new shared session"""
+        session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28'
+        })
+        if self.github_token:
+            session.headers['Authorization'] = f"Bearer {self.github_token}"
+        # Each repository worker has issues and commits in flight together
+        session.mount('https://', HTTPAdapter(pool_maxsize=self.max_workers * 2))
 
-    def _handle_rate_limit(self):
-        """Handle GitHub API rate limiting with exponential backoff"""
-        rate_limit = self.github.get_rate_limit()
-        reset_time = rate_limit.core.reset
-        current_time = datetime.now(pytz.UTC)
+    def _retry_delay(self, error: GithubException, retry_count: int) -> float:
+        """Seconds to wait before retrying a failed request
 
-        if reset_time > current_time:
-            sleep_time = (reset_time - current_time).total_seconds() + 1
+        Honors a Retry-After header (sent with secondary rate limits), and
+        otherwise uses full-jitter exponential backoff so parallel workers
+        don't retry in lockstep.
+        """
+        headers = {key.lower(): value for key, value in (error.headers or {}).items()}
+        retry_after = headers.get('retry-after')
+        if retry_after and retry_after.isdigit():
+            return int(retry_after) + random.uniform(0, 1)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_count)))
+
+    def _handle_rate_limit(self, error=None):
+        """Handle GitHub API rate limiting with exponential backoff
+
+        The reset time is read from the error's X-RateLimit-Reset header, or
+        from the last one seen on a successful response, before falling back
+        to an extra get_rate_limit() API call.
+        """
+        headers = {key.lower(): value for key, value in ((error and error.headers) or {}).items()}
+        if 'x-ratelimit-reset' in headers:
+            reset_ts = float(headers['x-ratelimit-reset'])
+        elif self._rate_limit_reset and self._rate_limit_reset > time.time():
+            reset_ts = self._rate_limit_reset
+        else:
+            reset_ts = self.github.get_rate_limit().core.reset.timestamp()
+        now_ts = time.time()
+
+        if reset_ts > now_ts:
+            sleep_time = reset_ts - now_ts + 1
             logger.warning(f"Rate limit exceeded. Waiting {sleep_time:.1f} seconds for reset...")
             time.sleep(sleep_time)
             return True
         return False
 
+    @staticmethod
+    def _hour_timestamp(value: datetime, round_up: bool = False) -> str:
+        """Format a query bound widened to a whole hour
+
+        Rolling windows such as "the last 7 days" would otherwise give every
+        request a new URL and defeat the ETag cache. Results are still
+        filtered to the exact range by the callers.
+        """
+        value = value.astimezone(pytz.UTC)
+        hour = value.replace(minute=0, second=0, microsecond=0)
+        if round_up and hour < value:
+            hour += timedelta(hours=1)
+        return hour.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def _get_paginated(self, path: str, params: dict, items_key: str = None):
+        """Yield items from a GitHub REST list endpoint, page by page
+
+        Pages are requested with If-None-Match so unchanged pages come back as
+        304, which GitHub does not count against the rate limit, and are served
+        from the local cache. Raises the same PyGithub exceptions as the object
+        API so callers can share rate limit and retry handling. Endpoints that
+        wrap their results in an object, like search, name the list with
+        items_key.
+        """
+        per_page = 100
+        page = 1
+        while True:
+            query = urlencode({**params, 'per_page': per_page, 'page': page})
+            url = f"{self.api_url}{path}?{query}"
+            cached = self.http_cache.get(url)
+            response = self.session.get(
+                url,
+                headers=self.http_cache.conditional_headers(cached),
+                timeout=30
+            )
+
+            if response.status_code == 304 and cached:
+                logger.debug("Not modified, using cached page for %s", url)
+                body = cached[2]
+                has_next = None
+            elif response.status_code == 200:
+                body = response.content
+                reset = response.headers.get('X-RateLimit-Reset')
+                if reset:
+                    self._rate_limit_reset = float(reset)
+                has_next = 'next' in response.links
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self.http_cache.set(url, (etag, last_modified, body))
+            else:
+                data = response.json() if 'json' in response.headers.get('Content-Type', '') else None
+                if response.status_code in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+                    raise RateLimitExceededException(response.status_code, data, dict(response.headers))
+                raise GithubException(response.status_code, data, dict(response.headers))
+
+            items = json.loads(body)
+            if items_key:
+                items = items[items_key]
+            yield from items
+            # Prefer the Link header; replayed pages fall back to a short-page check
+            if not (has_next if has_next is not None else len(items) == per_page):
+                return
+            page += 1
+
+    def _fetch_issues(self, repo_name: str, start_date: datetime, end_date: datetime):
+        """Fetch issues and pull requests created within the date range
+
+        Past ranges use the search API, which filters on creation date
+        server-side. The issue list filters on update time instead, so for an
+        old week it would page through every newer issue first. Recent ranges
+        keep using the list, since the search index can lag behind.
+        """
+        content = []
+        if end_date < datetime.now(timezone.utc) - self.search_lag:
+            created = f"{self._hour_timestamp(start_date)}..{self._hour_timestamp(end_date, round_up=True)}"
+            params = {'q': f"repo:{repo_name} created:{created}", 'sort': 'created', 'order': 'desc'}
+            issues = self._get_paginated("/search/issues", params, items_key='items')
+        else:
+            # Newest-created first lets us stop at the range start
+            params = {
+                'state': 'all',
+                'since': self._hour_timestamp(start_date),
+                'sort': 'created',
+                'direction': 'desc'
+            }
+            issues = self._get_paginated(f"/repos/{repo_name}/issues", params)
+
+        for issue in issues:
+            created_at = _parse_timestamp(issue['created_at'])
+            if created_at < start_date:
+                break
+            if created_at <= end_date:
+                content.append({
+                    'type': 'issue',
+                    'title': issue['title'],
+                    'url': issue['html_url'],
+                    'body': issue['body'],
+                    'created_at': created_at,
+                    'repository': repo_name,
+                    'labels': [label['name'] for label in issue['labels']]
+                })
+        return content
+
+    def _fetch_commits(self, repo_name: str, start_date: datetime, end_date: datetime):
+        """Fetch non-merge commits authored within the date range"""
+        content = []
+        params = {
+            'since': self._hour_timestamp(start_date),
+            'until': self._hour_timestamp(end_date, round_up=True)
+        }
+        for commit in self._get_paginated(f"/repos/{repo_name}/commits", params):
+            # Skip merge commits
+            if len(commit['parents']) > 1:
+                continue
+
+            author = commit['commit']['author']
+            commit_date = _parse_timestamp(author['date'])
+            if start_date <= commit_date <= end_date:
+                message = commit['commit']['message']
+                content.append({
+                    'type': 'commit',
+                    'title': message.split('\n', 1)[0],  # First line of the message
+                    'url': commit['html_url'],
+                    'body': message,
+                    'created_at': commit_date,
+                    'repository': repo_name,
+                    'author': author['name']
+                })
+        return content
+
+    def _cache_content(self, cache_key: tuple, content: list):
+        """Store a repository's content in the in-memory LRU"""
+        with self._content_cache_lock:
+            self._content_cache[cache_key] = (copy.deepcopy(content), time.time())
+            self._content_cache.move_to_end(cache_key)
+            while len(self._content_cache) > self._content_cache_size:
+                self._content_cache.popitem(last=False)
+
+    def _prefetch_graphql(self, start_date: datetime, end_date: datetime):
+        """Fetch every repository's content in one GraphQL request
+
+        Repositories whose results fit in the first page of each connection are
+        stored in the content cache, so _fetch_repository_content returns them
+        without REST calls. The rest are left to the REST path. GraphQL
+        requires authentication, so this is only used with a token.
+        """
+        now = time.time()
+        with self._content_cache_lock:
+            missing = [
+                repo_name for repo_name in self.repositories
+                if now - self._content_cache.get(
+                    (repo_name, start_date.isoformat(), end_date.isoformat()), (None, 0)
+                )[1] >= self._content_cache_ttl
+            ]
+        if not missing:
+            return
+
+        aliases = {f"r{index}": repo_name for index, repo_name in enumerate(missing)}
+        selections = "\n".join(
+            f'{alias}: repository(owner: "{repo_name.split("/")[0]}", name: "{repo_name.split("/")[1]}") {{ ...RepoContent }}'
+            for alias, repo_name in aliases.items()
+        )
+        query = (
+            "query($since: DateTime!, $gitSince: GitTimestamp!, $gitUntil: GitTimestamp!) {\n"
+            f"{selections}\n}}\n{_GRAPHQL_REPO_FRAGMENT}"
+        )
+        variables = {
+            'since': self._hour_timestamp(start_date),
+            'gitSince': self._hour_timestamp(start_date),
+            'gitUntil': self._hour_timestamp(end_date, round_up=True)
+        }
+
+        try:
+            response = self.session.post(
+                f"{self.api_url}/graphql",
+                json={'query': query, 'variables': variables},
+                timeout=60
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get('errors'):
+                logger.warning(f"GraphQL prefetch returned errors: {payload['errors'][0].get('message')}")
+            data = payload.get('data') or {}
+        except Exception as e:
+            logger.warning(f"GraphQL prefetch failed, using REST: {str(e)}")
+            return
+
+        for alias, repo_name in aliases.items():
+            content = self._parse_graphql_repo(data.get(alias), repo_name, start_date, end_date)
+            if content is None:
+                logger.info(f"GraphQL results incomplete for {repo_name}, using REST")
+                continue
+            content.sort(key=lambda x: x['created_at'], reverse=True)
+            self._cache_content((repo_name, start_date.isoformat(), end_date.isoformat()), content)
+
+    def _parse_graphql_repo(self, repo: dict, repo_name: str, start_date: datetime, end_date: datetime):
+        """Convert one repository's GraphQL result, or None if a page was cut off"""
+        if not repo or not repo.get('defaultBranchRef'):
+            return None
+
+        content = []
+        for connection in (repo['issues'], repo['pullRequests']):
+            nodes = connection['nodes']
+            # Newest-created first, so the range is covered once the page reaches its start
+            if connection['pageInfo']['hasNextPage'] and (
+                    not nodes or _parse_timestamp(nodes[-1]['createdAt']) >= start_date):
+                return None
+            for node in nodes:
+                created_at = _parse_timestamp(node['createdAt'])
+                if start_date <= created_at <= end_date:
+                    content.append({
+                        'type': 'issue',
+                        'title': node['title'],
+                        'url': node['url'],
+                        'body': node['body'],
+                        'created_at': created_at,
+                        'repository': repo_name,
+                        'labels': [label['name'] for label in node['labels']['nodes']]
+                    })
+
+        history = repo['defaultBranchRef']['target']['history']
+        if history['pageInfo']['hasNextPage']:
+            return None
+        for node in history['nodes']:
+            # Skip merge commits
+            if node['parents']['totalCount'] > 1:
+                continue
+            commit_date = _parse_timestamp(node['authoredDate'])
+            if start_date <= commit_date <= end_date:
+                message = node['message']
+                content.append({
+                    'type': 'commit',
+                    'title': message.split('\n', 1)[0],  # First line of the message
+                    'url': node['url'],
+                    'body': message,
+                    'created_at': commit_date,
+                    'repository': repo_name,
+                    'author': (node['author'] or {}).get('name')
+                })
+        return content
+
+    def _load_watermark(self, repo_name: str, start_date: datetime, end_date: datetime):
+        """Return the stored fetch end and items if they cover the start of this range"""
+        try:
+            with self._watermark_lock, open(self._watermark_path) as f:
+                watermark = json.load(f).get(repo_name)
+        except (OSError, ValueError):
+            return None, []
+        if not watermark or 'saved_at' not in watermark:
+            return None, []
+
+        if datetime.now(timezone.utc) - datetime.fromisoformat(watermark['saved_at']) > self.watermark_ttl:
+            return None, []
+        covered_start = datetime.fromisoformat(watermark['start'])
+        covered_end = datetime.fromisoformat(watermark['end'])
+        if not (covered_start <= start_date <= covered_end <= end_date):
+            return None, []
+
+        items = []
+        for item in watermark['items']:
+            item['created_at'] = datetime.fromisoformat(item['created_at'])
+            if item['created_at'] >= start_date:
+                items.append(item)
+        return covered_end, items
+
+    def _save_watermark(self, repo_name: str, start_date: datetime, fetched_at: datetime,
+                        end_date: datetime, content: list):
+        """Record the range and items of a successful fetch"""
+        # Items can still appear after the fetch, so a range ending later is only covered up to then
+        end_date = min(end_date, fetched_at)
+        items = [{**item, 'created_at': item['created_at'].isoformat()} for item in content]
+        directory = os.path.dirname(self._watermark_path)
+        try:
+            with self._watermark_lock:
+                try:
+                    with open(self._watermark_path) as f:
+                        watermarks = json.load(f)
+                except (OSError, ValueError):
+                    watermarks = {}
+
+                expired_before = fetched_at - self.watermark_ttl
+                watermarks = {
+                    name: entry for name, entry in watermarks.items()
+                    if 'saved_at' in entry and datetime.fromisoformat(entry['saved_at']) >= expired_before
+                }
+                watermarks[repo_name] = {
+                    'start': start_date.isoformat(),
+                    'end': end_date.isoformat(),
+                    'saved_at': fetched_at.isoformat(),
+                    'items': items
+                }
+
+                # Write a temporary file and swap it in, so readers never see a partial file
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='github_watermarks.', suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(watermarks, f)
+                    os.replace(tmp_path, self._watermark_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except OSError as e:
+            logger.warning(f"Failed to save fetch watermark for {repo_name}: {str(e)}")
+
     def _fetch_repository_content(self, repo_name: str, start_date: datetime, end_date: datetime):
-        """Fetch both issues and commits from a repository within the date range"""
+        """Fetch both issues and commits from a repository within the date range
+
+        When a previous fetch already covered the start of the range, only items
+        since shortly before its end are requested and the stored items fill in
+        the rest.
+        """
+        cache_key = (repo_name, start_date.isoformat(), end_date.isoformat())
+        with self._content_cache_lock:
+            cached = self._content_cache.get(cache_key)
+            if cached and time.time() - cached[1] < self._content_cache_ttl:
+                self._content_cache.move_to_end(cache_key)
+                logger.info(f"Using cached content for {repo_name}")
+                # Callers may mutate the items, so hand out a copy
+                return copy.deepcopy(cached[0])
+
+            # Another caller is already fetching this range; wait for its result
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                self._inflight[cache_key] = future = Future()
+
+        if pending is not None:
+            logger.info(f"Waiting for in-flight fetch of {repo_name}")
+            return copy.deepcopy(pending.result())
+
+        content = []
+        try:
+            content = self._fetch_repository_content_uncached(repo_name, start_date, end_date, cache_key)
+            return content
+        finally:
+            # Waiters get their own copy; the caller is free to mutate the one returned
+            future.set_result(copy.deepcopy(content))
+            with self._content_cache_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _fetch_repository_content_uncached(self, repo_name: str, start_date: datetime, end_date: datetime,
+                                           cache_key: tuple):
+        """Fetch a repository's content for the range from GitHub, with retries"""
         content = []
         retry_count = 0
 
         while retry_count < self.max_retries:
             try:
                 logger.info(f"Fetching content from {repo_name}")
-                repo = self.github.get_repo(repo_name)
-
-                # Fetch issues and pull requests
-                issues = list(repo.get_issues(state='all', since=start_date))
-                for issue in issues:
-                    created_at = issue.created_at.replace(tzinfo=pytz.UTC)
-                    if start_date <= created_at <= end_date:
-                        content.append({
-                            'type': 'issue',
-                            'title': issue.title,
-                            'url': issue.html_url,
-                            'body': issue.body,
-                            'created_at': created_at,
-                            'repository': repo_name,
-                            'labels': [label.name for label in issue.labels]
-                        })
-
-                # Fetch commits
-                commits = list(repo.get_commits(since=start_date, until=end_date))
-                for commit in commits:
-                    # Skip merge commits
-                    if len(commit.parents) > 1:
-                        continue
-
-                    commit_date = commit.commit.author.date.replace(tzinfo=pytz.UTC)
-                    if start_date <= commit_date <= end_date:
-                        # Get first line of commit message as title
-                        message_lines = commit.commit.message.split('\n')
-                        title = message_lines[0]
-                        content.append({
-                            'type': 'commit',
-                            'title': title,
-                            'url': commit.html_url,
-                            'body': commit.commit.message,
-                            'created_at': commit_date,
-                            'repository': repo_name,
-                            'author': commit.commit.author.name
-                        })
+                fetched_at = datetime.now(timezone.utc)
+                watermark, known_items = self._load_watermark(repo_name, start_date, end_date)
+                fetch_start = max(start_date, watermark - self.watermark_overlap) if watermark else start_date
+                if watermark:
+                    logger.info(f"Reusing {len(known_items)} items from {repo_name} fetched up to {watermark}")
+
+                # Issues and commits are independent endpoints, so page through both at once
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    issues_future = executor.submit(self._fetch_issues, repo_name, fetch_start, end_date)
+                    commits_future = executor.submit(self._fetch_commits, repo_name, fetch_start, end_date)
+                    fetched = issues_future.result() + commits_future.result()
+
+                # Offset pagination repeats items that shift pages mid-fetch, and items
+                # in the overlap come back in both sets; keep the first, fresh copy of each URL
+                unique = {}
+                for item in fetched + known_items:
+                    unique.setdefault(item['url'], item)
+                content = list(unique.values())
+                content.sort(key=lambda x: x['created_at'], reverse=True)
 
                 logger.info(f"Successfully fetched {len(content)} items from {repo_name}")
+                self._save_watermark(repo_name, start_date, fetched_at, end_date, content)
+                self._cache_content(cache_key, content)
                 return content
 
-            except RateLimitExceededException:
-                if self._handle_rate_limit():
+            except RateLimitExceededException as e:
+                if self._handle_rate_limit(e):
                     retry_count += 1
                     continue
                 else:
@@ -108,8 +544,7 @@ class GitHubService:
             except GithubException as e:
                 logger.error(f"GitHub API error for {repo_name}: {str(e)}")
                 retry_count += 1
-                delay = self.base_delay * (2 ** retry_count)
-                time.sleep(delay)
+                time.sleep(self._retry_delay(e, retry_count))
                 continue
 
             except Exception as e:
@@ -119,17 +554,36 @@ class GitHubService:
         logger.error(f"Failed to fetch from {repo_name} after {self.max_retries} retries")
         return []
 
-    def fetch_recent_content(self, start_date=None, end_date=None):
+    def fetch_recent_content(self, start_date=None, end_date=None, top_k=None, force_refresh=False):
         """
         Fetch content from all monitored Ethereum repositories in parallel.
 
         Args:
             start_date: Start date for content fetching (default: 7 days ago)
             end_date: End date for content fetching (default: now)
+            top_k: Return only the newest top_k items (default: all)
+            force_refresh: Ignore content cached for this date range
 
         Returns:
             List of dictionaries containing fetched content
         """
+        return list(islice(self.iter_recent_content(start_date, end_date, force_refresh), top_k))
+
+    def iter_recent_content(self, start_date=None, end_date=None, force_refresh=False):
+        """
+        Fetch content from all monitored repositories and iterate it newest first.
+
+        Repositories are fetched eagerly in parallel; the merged stream is lazy,
+        so consumers that process items one at a time never hold a combined list.
+
+        Args:
+            start_date: Start date for content fetching (default: 7 days ago)
+            end_date: End date for content fetching (default: now)
+            force_refresh: Ignore content cached for this date range
+
+        Returns:
+            Iterator of dictionaries containing fetched content
+        """
         if start_date is None:
             # Default to last 7 days
             end_date = datetime.now(pytz.UTC)
@@ -148,8 +602,19 @@ class GitHubService:
 
         logger.info(f"Fetching content from {start_date} to {end_date}")
 
-        all_content = []
-        repo_stats = {}
+        if force_refresh:
+            with self._content_cache_lock:
+                for repo in self.repositories:
+                    self._content_cache.pop((repo, start_date.isoformat(), end_date.isoformat()), None)
+
+        per_repo_content = []
+        repo_stats = Counter()
+
+        # One GraphQL round trip covers most recent weeks; anything it can't cover
+        # falls back to REST. Its pullRequests connection can't filter by date, so
+        # past weeks would never fit the first page and go straight to search.
+        if self.github_token and end_date >= datetime.now(timezone.utc) - self.search_lag:
+            self._prefetch_graphql(start_date, end_date)
 
         # Use ThreadPoolExecutor for parallel fetching
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -163,7 +628,7 @@ class GitHubService:
                 try:
                     content = future.result()
                     if content:
-                        all_content.extend(content)
+                        per_repo_content.append(content)
                         repo_stats[repo] = len(content)
                         logger.info(f"Added {len(content)} items from {repo}")
                     else:
@@ -175,10 +640,8 @@ class GitHubService:
 
         # Log repository statistics
         logger.info("Content fetch complete. Repository statistics:")
-        for repo, count in repo_stats.items():
+        for repo, count in repo_stats.most_common():
             logger.info(f"- {repo}: {count} items")
 
-        # Sort content by date
-        all_content.sort(key=lambda x: x['created_at'], reverse=True)
-
-        return all_content
\ No newline at end of file
+        # Each repository's list is already newest first, so merge instead of re-sorting
+        return heapq.merge(*per_repo_content, key=lambda x: x['created_at'], reverse=True)
\ No newline at end of file
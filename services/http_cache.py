@@ -0,0 +1,118 @@
+import itertools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import timedelta
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (etag, last_modified, body)
+CacheEntry = Tuple[Optional[str], Optional[str], bytes]
+
+# shelve falls back to dbm.dumb, which lets one process open a file several
+# times and interleave writes, so every cache on the same path shares a lock
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+
+def path_lock(path: str) -> threading.Lock:
+    """Return the lock serializing access to the shelve database at path."""
+    with _path_locks_guard:
+        return _path_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+class ConditionalRequestCache:
+    """SQLite-backed store of response validators and bodies for conditional GETs."""
+
+    # Expired rows and rows beyond max_entries are pruned every this many writes
+    prune_every = 100
+
+    def __init__(self, name: str, cache_dir: Optional[str] = None,
+                 ttl: timedelta = timedelta(days=30), max_entries: int = 5000):
+        """Initialize the cache.
+
+        Args:
+            name: File name of the SQLite database, without extension
+            cache_dir: Directory holding the database (default: instance/)
+            ttl: How long a stored response is offered for revalidation
+            max_entries: Most responses kept; the least recently stored go first
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.getcwd(), 'instance')
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"{name}.db")
+        self.ttl = ttl.total_seconds()
+        self.max_entries = max_entries
+        self._writes = itertools.count(1)
+
+        with closing(self._connect()) as conn, conn:
+            # WAL lets the fetch workers read while another thread writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL,
+                    stored_at REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_http_cache_stored_at ON http_cache (stored_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL, if any and not expired."""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT etag, last_modified, body FROM http_cache WHERE url = ? AND stored_at >= ?",
+                    (url, time.time() - self.ttl)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read HTTP cache for {url}: {str(e)}")
+            return None
+        return (row[0], row[1], bytes(row[2])) if row else None
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        """Store the validators and body returned for a URL."""
+        etag, last_modified, body = entry
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, body, time.time())
+                )
+                if next(self._writes) % self.prune_every == 0:
+                    self._prune(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write HTTP cache for {url}: {str(e)}")
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete expired rows and the oldest rows beyond max_entries."""
+        conn.execute("DELETE FROM http_cache WHERE stored_at < ?", (time.time() - self.ttl,))
+        conn.execute(
+            "DELETE FROM http_cache WHERE url IN "
+            "(SELECT url FROM http_cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> dict:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry."""
+        headers = {}
+        if entry:
+            etag, last_modified, _ = entry
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
@@ -1,71 +1,137 @@
+import asyncio
+import io
+import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, Union
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple, Union
 
-import pytz
 from openai import OpenAI
+from sqlalchemy import text
+from sqlalchemy.orm import load_only
 
-from app import db
+from app import app, db
 from models import Article, Source
+from services.clients import shared_openai_client
+from services.fetch_cache import TTLDiskCache
 from services.github_service import GitHubService
 from services.forum_service import ForumService
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Postgres advisory lock key held by whichever worker is generating an article
+_GENERATION_LOCK_KEY = 981234
+
+# Runs generations requested over HTTP; one at a time, as the lock allows no more
+_background_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='article-generation')
+
+class GenerationStart(Enum):
+    """Outcome of NewArticleGenerationService.start_generation."""
+    STARTED = 'started'
+    BUSY = 'busy'  # Another generation is queued or running
+    CONFLICT = 'conflict'  # The week already has an article
+    NOT_CONFIGURED = 'not_configured'
+
 class NewArticleGenerationService:
     """New implementation of article generation service with improved status tracking."""
 
+    # The status endpoint is polled and a service is built per request, so the
+    # cache lives on the class: (version, cached_at, status). Changes made in this
+    # process invalidate it; the TTL only bounds staleness from other workers.
+    status_cache_ttl = 3.0
+    _status_cache: Optional[Tuple[int, float, Dict]] = None
+    _status_version = 0
+    _status_lock = threading.Lock()
+    # Stand-in for the advisory lock on databases without one (SQLite in development)
+    _local_generation_lock = threading.Lock()
+    # Background generation submitted from this process, and the week and reason
+    # of the last one that failed
+    _pending_generation: Optional[Future] = None
+    _last_generation_error: Optional[Tuple[datetime, str]] = None
+
     def __init__(self):
-        """Initialize the service with required clients."""
+        """Initialize the service; API clients are created on first use."""
         try:
-            api_key = os.environ.get('OPENAI_API_KEY')
-            if not api_key:
-                logger.error("OPENAI_API_KEY environment variable is not set")
-                raise ValueError("OpenAI API key not configured. Please set up environment variables.")
-
-            self.openai = OpenAI(api_key=api_key)
             self.model = "gpt-4"  # Using stable model
-            self.github_service = GitHubService()
-            self.forum_service = ForumService()
+            # Fetched inputs per week, so retries and regenerations skip the fetch stage
+            self.fetch_cache = TTLDiskCache('article_fetch_cache', ttl=6 * 3600)
             logger.info("NewArticleGenerationService initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize NewArticleGenerationService: {str(e)}")
+            logger.error("Failed to initialize NewArticleGenerationService: %s", e)
             raise
 
-    def get_target_date(self, requested_date: Optional[datetime] = None) -> datetime:
-        """Calculate the appropriate target date for article generation."""
-        current_date = datetime.now(pytz.UTC)
+    @cached_property
+    def openai(self) -> OpenAI:
+        """OpenAI client, created when generation first needs it."""
+        api_key = os.environ.get('OPENAI_API_KEY')
+        if not api_key:
+            logger.error("OPENAI_API_KEY environment variable is not set")
+            raise ValueError("OpenAI API key not configured. Please set up environment variables.")
+        return shared_openai_client(api_key)
+
+    @cached_property
+    def github_service(self) -> GitHubService:
+        return GitHubService()
+
+    @cached_property
+    def forum_service(self) -> ForumService:
+        return ForumService()
+
+    def _build_clients(self) -> None:
+        """Create the GitHub and forum clients before worker threads share them.
+
+        cached_property does not lock, so concurrent first accesses from the
+        workers could each build a client and drop the others' caches.
+        """
+        if 'github_service' not in vars(self):
+            self.github_service = GitHubService()
+        if 'forum_service' not in vars(self):
+            self.forum_service = ForumService()
+
+    def get_target_date(self, requested_date: Optional[datetime] = None,
+                        now: Optional[datetime] = None) -> datetime:
+        """Calculate the appropriate target date for article generation.
 
+        Args:
+            requested_date: Any date in the wanted week (default: last week)
+            now: Current time, for callers that already took it
+        """
         if requested_date:
-            if not requested_date.tzinfo:
-                requested_date = pytz.UTC.localize(requested_date)
-            target_date = requested_date
+            tz = requested_date.tzinfo or timezone.utc
+            day = requested_date.date()
         else:
-            # Get the most recent past Monday
-            days_since_monday = current_date.weekday()
-            target_date = current_date - timedelta(days=days_since_monday + 7)
+            # A day in the previous week
+            tz = timezone.utc
+            day = (now or datetime.now(timezone.utc)).date() - timedelta(days=7)
+
+        # Monday of that week at start of day
+        monday = day - timedelta(days=day.weekday())
+        return datetime.combine(monday, datetime.min.time(), tzinfo=tz)
 
-        # Ensure date is a Monday and at start of day
-        target_date = target_date - timedelta(days=target_date.weekday())
-        return target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    @staticmethod
+    def week_bounds(week_start: datetime) -> Tuple[datetime, datetime]:
+        """Return the half-open [start, end) range of the week starting at week_start."""
+        return week_start, week_start + timedelta(days=7)
 
     def check_conflicts(self, target_date: datetime) -> Tuple[bool, str, Optional[Article]]:
         """Check for existing or in-progress articles."""
         try:
-            # First check for any article in generating status
-            generating_article = Article.query.filter_by(status='generating').first()
-            if generating_article:
-                return True, "Another article is currently being generated", generating_article
-
-            # Then check for existing article in the target week
-            week_start = target_date
-            week_end = week_start + timedelta(days=7)
-            existing_article = Article.query.filter(
+            # Concurrent generation is excluded by generation_lock, so only the week matters
+            week_start, week_end = self.week_bounds(target_date)
+            # Leave the large content column deferred; callers only need the row's identity
+            existing_article = Article.query.options(
+                load_only(Article.id, Article.title, Article.publication_date, Article.status)
+            ).filter(
                 Article.publication_date >= week_start,
                 Article.publication_date < week_end
-            ).first()
+            ).limit(1).first()
 
             if existing_article:
                 msg = f"Article already exists for week of {week_start.strftime('%Y-%m-%d')}"
@@ -74,14 +140,102 @@ class NewArticleGenerationService:
             return False, "", None
 
         except Exception as e:
-            logger.error(f"Error checking for conflicts: {str(e)}")
+            logger.error("Error checking for conflicts: %s", e)
             raise
 
+    @classmethod
+    def _invalidate_generation_status(cls) -> None:
+        """Drop the cached generation status after an article changes state."""
+        with cls._status_lock:
+            cls._status_version += 1
+            cls._status_cache = None
+
+    @classmethod
+    @contextmanager
+    def generation_lock(cls):
+        """Try to become the only generating worker; yields whether the lock was taken.
+
+        On Postgres this is a session advisory lock held on a dedicated connection,
+        so it spans workers and is released even if the process dies.
+        """
+        if db.engine.dialect.name != 'postgresql':
+            acquired = cls._local_generation_lock.acquire(blocking=False)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    cls._local_generation_lock.release()
+            return
+
+        # Autocommit, so the connection doesn't sit idle in a transaction for the
+        # whole generation; session-level advisory locks outlive transactions
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:k)"), {'k': _GENERATION_LOCK_KEY}
+            ).scalar()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    conn.execute(text("SELECT pg_advisory_unlock(:k)"), {'k': _GENERATION_LOCK_KEY})
+
+    def _is_generation_locked(self) -> bool:
+        """Return whether some worker currently holds the generation lock."""
+        if db.engine.dialect.name != 'postgresql':
+            return self._local_generation_lock.locked()
+
+        return bool(db.session.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory' "
+                "AND classid = 0 AND objid = :k AND objsubid = 1)"
+            ),
+            {'k': _GENERATION_LOCK_KEY}
+        ).scalar())
+
     def get_generation_status(self) -> Dict[str, Union[bool, str, int]]:
-        """Get current generation status and any errors."""
+        """Get current generation status, reusing a result younger than status_cache_ttl."""
+        cls = type(self)
+        with cls._status_lock:
+            cached = cls._status_cache
+            version = cls._status_version
+        if cached and cached[0] == version and time.monotonic() - cached[1] < self.status_cache_ttl:
+            return dict(cached[2])
+
+        status = self._query_generation_status()
+        if status['status'] != 'error':
+            with cls._status_lock:
+                if cls._status_version == version:
+                    cls._status_cache = (version, time.monotonic(), status)
+        return dict(status)
+
+    def _query_generation_status(self) -> Dict[str, Union[bool, str, int]]:
+        """Get current generation status and any errors from the database."""
         try:
+            pending = type(self)._pending_generation
+            if self._is_generation_locked() or (pending and not pending.done()):
+                return {
+                    "is_generating": True,
+                    "article_id": None,
+                    "status": "generating",
+                    "error": None
+                }
+
+            failure = type(self)._last_generation_error
+            if failure:
+                failed_week, error = failure
+                # The scheduler or a later run may have produced the week since
+                if self._week_has_article(failed_week):
+                    type(self)._last_generation_error = None
+                else:
+                    return {
+                        "is_generating": False,
+                        "article_id": None,
+                        "status": "failed",
+                        "error": error
+                    }
+
             # Check for generating articles
-            generating_article = Article.query.filter_by(status='generating').first()
+            generating_article = Article.query.with_entities(Article.id).filter_by(status='generating').limit(1).first()
             if generating_article:
                 return {
                     "is_generating": True,
@@ -91,7 +245,9 @@ class NewArticleGenerationService:
                 }
 
             # Check for recent failed articles
-            failed_article = Article.query.filter_by(status='failed').order_by(Article.publication_date.desc()).first()
+            failed_article = Article.query.with_entities(Article.id, Article.content).filter_by(
+                status='failed'
+            ).order_by(Article.publication_date.desc()).limit(1).first()
             if failed_article:
                 return {
                     "is_generating": False,
@@ -108,19 +264,68 @@ class NewArticleGenerationService:
             }
 
         except Exception as e:
-            logger.error(f"Error getting generation status: {str(e)}")
+            logger.error("Error getting generation status: %s", e)
             return {
                 "is_generating": False,
                 "status": "error",
                 "error": str(e)
             }
 
+    def _week_has_article(self, week_start: datetime) -> bool:
+        """Whether an article other than a failed attempt exists for the week."""
+        week_start, week_end = self.week_bounds(week_start)
+        return Article.query.with_entities(Article.id).filter(
+            Article.publication_date >= week_start,
+            Article.publication_date < week_end,
+            Article.status != 'failed'
+        ).limit(1).first() is not None
+
+    def start_generation(self, target_date: Optional[datetime] = None) -> Tuple[GenerationStart, str]:
+        """Queue generation of an article in the background and return immediately.
+
+        Returns:
+            The outcome, and a message explaining it when generation was not queued
+        """
+        target_date = self.get_target_date(target_date)
+
+        if not os.environ.get('DATABASE_URL'):
+            return GenerationStart.NOT_CONFIGURED, "Database URL not configured"
+
+        has_conflict, msg, _ = self.check_conflicts(target_date)
+        if has_conflict:
+            return GenerationStart.CONFLICT, msg
+
+        cls = type(self)
+        with cls._status_lock:
+            pending = cls._pending_generation
+            if (pending and not pending.done()) or self._is_generation_locked():
+                return GenerationStart.BUSY, "Another article is currently being generated"
+            cls._last_generation_error = None
+            cls._pending_generation = _background_executor.submit(self._generate_in_background, target_date)
+
+        self._invalidate_generation_status()
+        logger.info("Queued article generation for week of %s", target_date.date())
+        return GenerationStart.STARTED, ""
+
+    def _generate_in_background(self, target_date: datetime) -> None:
+        """Run generate_article on the background worker and record a failure for the status API."""
+        failure = (target_date, f"Article generation failed for week of {target_date.strftime('%Y-%m-%d')}")
+        with app.app_context():
+            try:
+                if self.generate_article(target_date):
+                    failure = None
+            finally:
+                db.session.remove()
+
+        type(self)._last_generation_error = failure
+        self._invalidate_generation_status()
+
     def generate_article(self, target_date: Optional[datetime] = None) -> Optional[Article]:
         """Generate a new article with improved error handling."""
         try:
             # Calculate target date
             target_date = self.get_target_date(target_date)
-            logger.info(f"Starting article generation for week of {target_date.strftime('%Y-%m-%d')}")
+            logger.info("Starting article generation for week of %s", target_date.date())
 
             # Check database configuration
             if not os.environ.get('DATABASE_URL'):
@@ -128,47 +333,286 @@ class NewArticleGenerationService:
                 logger.error(error_msg)
                 return None
 
-            # Check for conflicts and prevent regeneration
-            has_conflict, msg, existing_article = self.check_conflicts(target_date)
-            if has_conflict or existing_article:
-                logger.warning(f"Article already exists or conflict found: {msg}")
-                return existing_article
+            with self.generation_lock() as acquired:
+                if not acquired:
+                    logger.warning("Another article is currently being generated")
+                    return None
+
+                self._invalidate_generation_status()
+                try:
+                    return self._generate_for_week(target_date)
+                finally:
+                    self._invalidate_generation_status()
+
+        except Exception as e:
+            logger.error("Fatal error in generate_article: %s", e, exc_info=True)
+            return None
+
+    def generate_many(self, target_dates: List[datetime], max_concurrency: int = 4) -> List[int]:
+        """Generate articles for several weeks concurrently with live OpenAI calls.
+
+        The generation lock is taken once for the whole run, and at most
+        max_concurrency weeks are in flight to stay within the OpenAI rate limit.
+
+        Returns:
+            IDs of the articles created or already present, in the order of target_dates
+        """
+        weeks = list(dict.fromkeys(self.get_target_date(d) for d in target_dates))
 
+        with self.generation_lock() as acquired:
+            if not acquired:
+                logger.warning("Another article is currently being generated")
+                return []
+
+            self._invalidate_generation_status()
+            self._build_clients()
             try:
-                # Fetch GitHub content
-                github_content = self.github_service.fetch_recent_content(
-                    start_date=target_date,
-                    end_date=target_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-                )
+                article_ids = asyncio.run(self._agenerate_many(weeks, max_concurrency))
+            finally:
+                self._invalidate_generation_status()
 
-                if not github_content:
-                    logger.warning(f"No content found for the week of {target_date.strftime('%Y-%m-%d')}")
-                    return None
+        return [article_id for article_id in article_ids if article_id]
 
-                # Generate the article content
-                from services.content_service import ContentService
-                content_service = ContentService()
+    async def _agenerate_many(self, weeks: List[datetime], max_concurrency: int) -> List[Optional[int]]:
+        """Run _generate_week_in_context for each week, at most max_concurrency at a time."""
+        sem = asyncio.Semaphore(max_concurrency)
 
-                generated_article = content_service.generate_weekly_summary(
-                    github_content,
-                    target_date
-                )
+        async def guarded(target_date: datetime) -> Optional[int]:
+            async with sem:
+                return await asyncio.to_thread(self._generate_week_in_context, target_date)
+
+        return await asyncio.gather(*(guarded(week) for week in weeks))
+
+    def _generate_week_in_context(self, target_date: datetime) -> Optional[int]:
+        """Generate one week's article on a worker thread with its own app context and session."""
+        with app.app_context():
+            try:
+                article = self._generate_for_week(target_date)
+                return article.id if article else None
+            except Exception as e:
+                logger.error("Error generating article for week of %s: %s", target_date.date(), e)
+                return None
+            finally:
+                db.session.remove()
+
+    def _generate_for_week(self, target_date: datetime) -> Optional[Article]:
+        """Fetch the week's content and generate its article; caller holds the generation lock."""
+        # Check for conflicts and prevent regeneration
+        has_conflict, msg, existing_article = self.check_conflicts(target_date)
+        if has_conflict or existing_article:
+            logger.warning("Article already exists or conflict found: %s", msg)
+            return existing_article
+
+        try:
+            # GitHub and the forums are independent, so fetch them at the same time
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                github_future = executor.submit(self._fetch_github_content, target_date)
+                forum_future = executor.submit(self._fetch_forum_summary, target_date)
+                github_content = github_future.result()
 
-                if not generated_article:
-                    logger.error("Failed to generate article content")
+                if not github_content:
+                    logger.warning("No content found for the week of %s", target_date.date())
+                    forum_future.cancel()
                     return None
 
-                logger.info(f"Successfully generated article: {generated_article.title}")
-                return generated_article
+                forum_summary = forum_future.result()
 
-            except Exception as e:
-                logger.error(f"Error during article generation: {str(e)}", exc_info=True)
+            # Generate the article content
+            from services.content_service import ContentService
+            content_service = ContentService()
+
+            generated_article = content_service.generate_weekly_summary(
+                github_content,
+                target_date,
+                forum_summary=forum_summary
+            )
+
+            if not generated_article:
+                logger.error("Failed to generate article content")
                 return None
 
+            logger.info("Successfully generated article: %s", generated_article.title)
+            return generated_article
+
         except Exception as e:
-            logger.error(f"Fatal error in generate_article: {str(e)}", exc_info=True)
+            logger.error("Error during article generation: %s", e, exc_info=True)
             return None
 
+    def generate_articles_bulk(self, target_dates: List[datetime], poll_interval: float = 60) -> List[Article]:
+        """Back-fill several weeks through one OpenAI Batch API job.
+
+        The batch carries each week's main article completion. Batch requests
+        cost half as much as live calls and do not count against the interactive
+        rate limit, but may take up to 24h; this blocks until the job finishes,
+        so run it from a script or background task. The overview paragraph is
+        written from the completed article, so saving each week still makes
+        one short live call for it.
+
+        The generation lock is held for the whole run, from the conflict checks
+        to the inserts, so the scheduler and HTTP generation wait it out.
+
+        Args:
+            target_dates: Any date within each week to generate
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Articles created, in the order of their weeks
+        """
+        with self.generation_lock() as acquired:
+            if not acquired:
+                logger.warning("Another article is currently being generated")
+                return []
+
+            self._invalidate_generation_status()
+            try:
+                return self._generate_articles_bulk_locked(target_dates, poll_interval)
+            finally:
+                self._invalidate_generation_status()
+
+    def _generate_articles_bulk_locked(self, target_dates: List[datetime], poll_interval: float) -> List[Article]:
+        """Run generate_articles_bulk; the caller holds the generation lock."""
+        from services.content_service import ContentService
+        content_service = ContentService()
+
+        # Fetch every week's inputs up front; the batch only covers the article completions
+        weeks = {}
+        requests_file = io.BytesIO()
+        for requested in target_dates:
+            target_date = self.get_target_date(requested)
+            custom_id = target_date.date().isoformat()
+            if custom_id in weeks:
+                continue
+
+            has_conflict, msg, _ = self.check_conflicts(target_date)
+            if has_conflict:
+                logger.info("Skipping week of %s: %s", custom_id, msg)
+                continue
+
+            github_content = self._fetch_github_content(target_date)
+            messages = content_service.build_article_messages(github_content, target_date) if github_content else None
+            if not messages:
+                logger.warning("No content found for the week of %s", custom_id)
+                continue
+
+            weeks[custom_id] = (target_date, github_content)
+            requests_file.write(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": content_service.model,
+                    "messages": messages,
+                    "temperature": content_service.temperature,
+                    "max_tokens": content_service.max_output_tokens
+                }
+            }).encode() + b"\n")
+
+        if not weeks:
+            logger.info("No weeks left to generate")
+            return []
+
+        # End the conflict checks' transaction; otherwise the connection sits idle in
+        # it through the forum summaries and the batch, for up to a day
+        db.session.rollback()
+
+        # Summarize the forums for every week at once rather than one week after another
+        forum_summaries = dict(zip(weeks, self._fetch_forum_summaries([week[0] for week in weeks.values()])))
+
+        batch_file = self.openai.files.create(
+            file=("article_batch.jsonl", requests_file.getvalue()),
+            purpose="batch"
+        )
+        batch = self.openai.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted batch %s for %s weeks", batch.id, len(weeks))
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.openai.batches.retrieve(batch.id)
+            logger.info("Batch %s status: %s", batch.id, batch.status)
+
+        if not batch.output_file_id:
+            logger.error("Batch %s finished as %s without output", batch.id, batch.status)
+            return []
+
+        completions = {}
+        for line in self.openai.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error("Batch request %s failed: %s", result.get('custom_id'), result.get('error') or response)
+                continue
+            completions[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+        articles = []
+        for custom_id in sorted(completions):
+            target_date, github_content = weeks[custom_id]
+            forum_summary = forum_summaries[custom_id]
+            try:
+                article = content_service.generate_weekly_summary(
+                    github_content,
+                    target_date,
+                    forum_summary=forum_summary,
+                    completion=completions[custom_id]
+                )
+            except Exception as e:
+                logger.error("Failed to save article for week of %s: %s", custom_id, e)
+                continue
+            if article:
+                articles.append(article)
+
+        logger.info("Batch %s produced %s of %s articles", batch.id, len(articles), len(weeks))
+        return articles
+
+    def _fetch_github_content(self, target_date: datetime) -> list:
+        """Fetch the week's GitHub content, reusing a recent fetch for the same week."""
+        key = f"{target_date.date().isoformat()}:github"
+        github_content = self.fetch_cache.get(key)
+        if github_content:
+            logger.info("Using cached GitHub content for week of %s", target_date.date())
+            return github_content
+
+        github_content = self.github_service.fetch_recent_content(
+            start_date=target_date,
+            end_date=target_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
+        )
+        if github_content:
+            self.fetch_cache.set(key, github_content)
+        return github_content
+
+    def _fetch_forum_summary(self, target_date: datetime) -> Optional[str]:
+        """Fetch the week's forum summary, reusing a recent one for the same week."""
+        key = f"{target_date.date().isoformat()}:forum"
+        forum_summary = self.fetch_cache.get(key)
+        if forum_summary:
+            logger.info("Using cached forum summary for week of %s", target_date.date())
+            return forum_summary
+
+        forum_summary, complete = self.forum_service.summarize_week(target_date)
+        # Error pages and raw fallbacks are not worth keeping; the next attempt should try again
+        if complete:
+            self.fetch_cache.set(key, forum_summary)
+        return forum_summary
+
+    def _fetch_forum_summaries(self, target_dates: List[datetime]) -> List[Optional[str]]:
+        """Fetch several weeks' forum summaries, summarizing the uncached weeks concurrently."""
+        summaries = [self.fetch_cache.get(f"{d.date().isoformat()}:forum") for d in target_dates]
+        missing = [i for i, summary in enumerate(summaries) if not summary]
+        if not missing:
+            return summaries
+
+        pages = self.forum_service.summarize_weeks([target_dates[i] for i in missing])
+        for i, (forum_summary, complete) in zip(missing, pages):
+            summaries[i] = forum_summary
+            if complete:
+                self.fetch_cache.set(f"{target_dates[i].date().isoformat()}:forum", forum_summary)
+        return summaries
+
     def update_article_status(self, article: Article, status: str, error: Optional[str] = None) -> None:
         """Update article status and error message if any."""
         try:
@@ -176,10 +620,11 @@ class NewArticleGenerationService:
             if error:
                 article.content = f"<div class='alert alert-danger'>{error}</div>"
             if status == 'published':
-                article.published_date = datetime.now(pytz.UTC)
+                article.published_date = datetime.now(timezone.utc)
             db.session.commit()
-            logger.info(f"Updated article {article.id} status to: {status}")
+            self._invalidate_generation_status()
+            logger.info("Updated article %s status to: %s", article.id, status)
         except Exception as e:
-            logger.error(f"Error updating article status: {str(e)}")
+            logger.error("Error updating article status: %s", e)
             db.session.rollback()
             raise
\ No newline at end of file
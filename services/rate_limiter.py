@@ -0,0 +1,31 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing bursts of up to `rate` calls per `period` seconds."""
+
+    def __init__(self, rate: int, period: float = 1.0):
+        self.capacity = rate
+        self.refill_rate = rate / period  # tokens per second
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.refill_rate
+
+            logger.debug("Rate limiting: sleeping for %.2f seconds", wait)
+            time.sleep(wait)
@@ -1,53 +1,91 @@
 import logging
+import threading
+from functools import wraps
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime, timedelta
+from apscheduler.triggers.date import DateTrigger
+from datetime import datetime, time, timedelta, timezone
 import pytz
 from services.github_service import GitHubService
 from services.content_service import ContentService
+from services.new_article_generation_service import NewArticleGenerationService
 from app import db, app
 from models import Article
 
 logger = logging.getLogger(__name__)
 
-def get_previous_week_dates():
-    """Get the start and end dates for the previous week (Monday to Sunday)"""
-    current_date = datetime.now(pytz.UTC)
-    current_date = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
+# Running scheduler, so scheduled articles can add their own publish job
+_scheduler = None
+
+# Services reused across weekly runs, built on first use
+_github_service = None
+_content_service = None
+_services_lock = threading.Lock()
 
-    # Calculate previous week's Monday
-    days_since_monday = current_date.weekday()
-    previous_monday = current_date - timedelta(days=days_since_monday + 7)
-    previous_monday = previous_monday.replace(hour=0, minute=0, second=0, microsecond=0)
+def get_previous_week_dates(now=None):
+    """Get the start and end dates for the previous week (Monday to Sunday)"""
+    today = (now or datetime.now(timezone.utc)).date()
 
-    # Calculate previous week's Sunday
+    # Previous week's Monday at midnight UTC, and its Sunday at 23:59:59
+    previous_monday = datetime.combine(
+        today - timedelta(days=today.weekday() + 7), time.min, tzinfo=timezone.utc
+    )
     previous_sunday = previous_monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
 
     return previous_monday, previous_sunday
 
+def _get_services():
+    """Return the shared GitHub and content services, creating them on first use"""
+    global _github_service, _content_service
+    with _services_lock:
+        if _github_service is None:
+            _github_service = GitHubService()
+        if _content_service is None:
+            _content_service = ContentService()
+        return _github_service, _content_service
+
+def with_app_context(job):
+    """Run a scheduler job inside an app context and release its session afterwards"""
+    @wraps(job)
+    def wrapper(*args, **kwargs):
+        with app.app_context():
+            try:
+                return job(*args, **kwargs)
+            finally:
+                db.session.remove()
+    return wrapper
+
+@with_app_context
 def generate_weekly_article():
     """Generate article for the previous week's content"""
     try:
-        with app.app_context():
-            # Get previous week's date range
-            start_date, end_date = get_previous_week_dates()
-
-            # Only generate if it's Monday
-            current_date = datetime.now(pytz.UTC)
-            if current_date.weekday() != 0:
-                logger.info("Skipping article generation - not Monday")
+        # Get previous week's date range
+        current_date = datetime.now(timezone.utc)
+        start_date, end_date = get_previous_week_dates(current_date)
+
+        # Only generate if it's Monday
+        if current_date.weekday() != 0:
+            logger.info("Skipping article generation - not Monday")
+            return
+
+        logger.info("Generating article for week of %s", start_date.date())
+
+        # Held across workers (advisory lock on Postgres) so only one process
+        # generates the week, also against generation requested over HTTP
+        with NewArticleGenerationService.generation_lock() as acquired:
+            if not acquired:
+                logger.info("Another worker is generating an article, skipping")
                 return
 
-            logger.info(f"Generating article for week of {start_date.strftime('%Y-%m-%d')}")
-
-            # Check if article already exists for this week
-            existing = Article.query.filter(
+            # Check if article already exists for this week; only the columns logged below
+            existing = Article.query.with_entities(Article.title, Article.status).filter(
                 Article.publication_date >= start_date,
                 Article.publication_date <= end_date
-            ).first()
+            ).limit(1).first()
 
             if existing:
-                logger.info(f"Article already exists for week: {existing.title}")
+                logger.info("Article already exists for week: %s", existing.title)
                 if existing.status == 'published':
                     logger.info("Article is already published, skipping generation")
                     return
@@ -55,12 +93,10 @@ def generate_weekly_article():
                     logger.info("Article is currently being generated, skipping")
                     return
                 else:
-                    logger.info(f"Article exists but has status: {existing.status}")
+                    logger.info("Article exists but has status: %s", existing.status)
                     return
 
-            # Initialize services
-            github_service = GitHubService()
-            content_service = ContentService()
+            github_service, content_service = _get_services()
 
             # Fetch content for the previous week only
             github_content = github_service.fetch_recent_content(
@@ -69,28 +105,68 @@ def generate_weekly_article():
             )
 
             if github_content:
-                # Generate article with explicit Monday date
+                # Generate article with explicit Monday date; it is saved as published
+                # together with its sources in a single commit
                 article = content_service.generate_weekly_summary(
                     github_content,
                     publication_date=start_date
                 )
 
                 if article:
-                    article.status = 'published'
-                    article.published_date = current_date
-                    db.session.commit()
-                    logger.info(f"Generated and published article: {article.title}")
+                    logger.info("Generated and published article: %s", article.title)
                 else:
                     logger.error("Failed to generate article")
             else:
                 logger.warning("No content found for the previous week")
 
     except Exception as e:
-        logger.error(f"Error in weekly article generation task: {str(e)}")
+        db.session.rollback()
+        logger.error("Error in weekly article generation task: %s", e)
+
+@with_app_context
+def publish_scheduled_article(article_id):
+    """Publish one scheduled article when its publish date arrives"""
+    try:
+        article = db.session.get(Article, article_id)
+        if not article or article.status != 'scheduled':
+            logger.info("Article %s is no longer scheduled, skipping publication", article_id)
+            return
+        article.publish()
+        logger.info("Published scheduled article: %s", article.title)
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error publishing scheduled article %s: %s", article_id, e)
+
+def schedule_publication(article_id, publish_date):
+    """Add a one-off job publishing the article at publish_date
+
+    Replaces any earlier job for the same article. No-op when the scheduler
+    is not running in this process.
+    """
+    if _scheduler is None:
+        return
+    _scheduler.add_job(
+        publish_scheduled_article,
+        trigger=DateTrigger(run_date=publish_date, timezone=pytz.UTC),
+        args=[article_id],
+        id=f'publish_article_{article_id}',
+        replace_existing=True,
+        misfire_grace_time=None  # Publish overdue articles however late the job runs
+    )
+    logger.info("Scheduled article %s for publication at %s", article_id, publish_date)
 
 def init_scheduler():
     """Initialize the scheduler with weekly article generation task"""
-    scheduler = BackgroundScheduler()
+    # Weekly generation spends minutes waiting on GitHub and OpenAI; give it its own
+    # worker so short jobs such as scheduled publications never queue behind it
+    scheduler = BackgroundScheduler(
+        executors={
+            'default': ThreadPoolExecutor(max_workers=2),
+            'generation': ThreadPoolExecutor(max_workers=1)
+        },
+        # Never overlap a job with itself, and run a backlog of missed fires once
+        job_defaults={'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 3600}
+    )
 
     # Schedule article generation only on Mondays at 9:00 UTC
     scheduler.add_job(
@@ -98,9 +174,21 @@ def init_scheduler():
         trigger=CronTrigger(day_of_week='mon', hour=9, minute=0),
         id='generate_weekly_article',
         name='Generate weekly Ethereum update',
-        replace_existing=True,
-        misfire_grace_time=3600  # Allow 1 hour grace time for misfires
+        executor='generation',
+        replace_existing=True
     )
 
     scheduler.start()
+    global _scheduler
+    _scheduler = scheduler
+
+    # Re-arm publish jobs for articles scheduled before this process started
+    with app.app_context():
+        pending = db.session.query(Article.id, Article.scheduled_publish_date).filter(
+            Article.status == 'scheduled',
+            Article.scheduled_publish_date.isnot(None)
+        ).all()
+    for article_id, publish_date in pending:
+        schedule_publication(article_id, publish_date)
+
     logger.info("Scheduler initialized with article generation task")
\ No newline at end of file
@@ -0,0 +1,115 @@
+import json
+import logging
+import math
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import timedelta
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticSummaryCache:
+    """SQLite-backed cache mapping discussion embeddings to generated summaries."""
+
+    def __init__(self, db_path: Optional[str] = None, threshold: float = 0.95,
+                 ttl: timedelta = timedelta(days=7)):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path of the SQLite file (default: instance/summary_cache.db)
+            threshold: Minimum cosine similarity for a cache hit
+            ttl: How long a cached summary stays valid
+        """
+        if db_path is None:
+            cache_dir = os.path.join(os.getcwd(), 'instance')
+            os.makedirs(cache_dir, exist_ok=True)
+            db_path = os.path.join(cache_dir, 'summary_cache.db')
+        self.db_path = db_path
+        self.threshold = threshold
+        self.ttl = ttl.total_seconds()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS summary_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    namespace TEXT NOT NULL,
+                    embedding TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_summary_cache_namespace ON summary_cache (namespace)"
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS summary_exact_cache (
+                    digest TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )"""
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _cosine_similarity(a: List[float], b: List[float]) -> float:
+        dot = math.fsum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(math.fsum(x * x for x in a)) * math.sqrt(math.fsum(y * y for y in b))
+        return dot / norm if norm else 0.0
+
+    def lookup_exact(self, digest: str) -> Optional[str]:
+        """Return the summary stored for an exact input digest, if still fresh."""
+        cutoff = time.time() - self.ttl
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT summary FROM summary_exact_cache WHERE digest = ? AND created_at >= ?",
+                (digest, cutoff)
+            ).fetchone()
+
+        if row:
+            logger.info(f"Summary cache exact hit for {digest[:12]}")
+            return row[0]
+        return None
+
+    def lookup(self, namespace: str, embedding: List[float]) -> Optional[str]:
+        """Return the closest cached summary in the namespace above the threshold."""
+        cutoff = time.time() - self.ttl
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM summary_cache WHERE created_at < ?", (cutoff,))
+            rows = conn.execute(
+                "SELECT embedding, summary FROM summary_cache WHERE namespace = ?",
+                (namespace,)
+            ).fetchall()
+
+        best_score, best_summary = 0.0, None
+        for stored_embedding, summary in rows:
+            score = self._cosine_similarity(embedding, json.loads(stored_embedding))
+            if score > best_score:
+                best_score, best_summary = score, summary
+
+        if best_summary is not None and best_score >= self.threshold:
+            logger.info(f"Summary cache hit for {namespace} (similarity {best_score:.3f})")
+            return best_summary
+
+        logger.info(f"Summary cache miss for {namespace}")
+        return None
+
+    def store(self, namespace: str, embedding: List[float], summary: str) -> None:
+        """Store a generated summary under its embedding."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO summary_cache (namespace, embedding, summary, created_at) VALUES (?, ?, ?, ?)",
+                (namespace, json.dumps(embedding), summary, time.time())
+            )
+
+    def store_exact(self, digest: str, summary: str) -> None:
+        """Store a generated summary under the digest of its exact input."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summary_exact_cache (digest, summary, created_at) VALUES (?, ?, ?)",
+                (digest, summary, time.time())
+            )